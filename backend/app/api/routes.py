@@ -1,17 +1,36 @@
 from __future__ import annotations
 
-import tempfile
+import os
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Annotated, Any, Callable, Dict, Iterator, Optional, Tuple
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
-from fastapi.responses import FileResponse
-from pydantic import BaseModel
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, StreamingResponse
+from pydantic import BaseModel, Field, model_validator
 
-from ..services import dataset, search
+from ..services import dataset, jobs, search
+from .responses import FastJSONResponse, dumps
 
 router = APIRouter(prefix="/api", tags=["api"])
 
+# When set (e.g. "/tiles_internal/"), tiles are handed to a fronting nginx via
+# X-Accel-Redirect so the bytes never pass through Python.
+TILES_ACCEL_PREFIX = os.environ.get("TILES_ACCEL_PREFIX")
+
+# Tiles and previews only change when a scene is re-tiled; lower this (e.g.
+# "public, max-age=60") when regenerating scenes in place.
+TILE_CACHE_CONTROL = os.environ.get("TILE_CACHE_CONTROL", "public, max-age=31536000, immutable")
+
+TILE_MEDIA_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".tif": "image/tiff",
+    ".tiff": "image/tiff",
+}
+
 
 class InitRequest(BaseModel):
     force: bool = False
@@ -22,6 +41,22 @@ class InitRequest(BaseModel):
     tiles_dir: str = "tiles"
     converter: Optional[str] = None
     data_path: Optional[str] = None
+    direct_tiles: bool = False
+    stream_tiles: bool = False
+
+
+class BBox(BaseModel):
+    # Longitudes accept both the -180..180 and the 0..360 (HiRISE label) conventions.
+    min_lat: float = Field(ge=-90, le=90)
+    min_lon: float = Field(ge=-180, le=360)
+    max_lat: float = Field(ge=-90, le=90)
+    max_lon: float = Field(ge=-180, le=360)
+
+    @model_validator(mode="after")
+    def _check_order(self) -> "BBox":
+        if self.min_lat >= self.max_lat or self.min_lon >= self.max_lon:
+            raise ValueError("Bounding box minimums must be smaller than its maximums.")
+        return self
 
 
 @router.get("/health")
@@ -30,7 +65,7 @@ def health() -> Dict[str, str]:
 
 
 @router.post("/init")
-def initialize_dataset(payload: InitRequest) -> Dict[str, Any]:
+def initialize_dataset(payload: InitRequest):
     data_path = dataset.resolve_data_path(payload.data_path)
     existing = dataset.list_manifests(data_path)
     ready = dataset.manifests_ready(existing)
@@ -41,7 +76,7 @@ def initialize_dataset(payload: InitRequest) -> Dict[str, Any]:
             "manifests": existing,
         }
     try:
-        result = dataset.run_converter(
+        options, _ = dataset.build_converter_options(
             data_path=data_path,
             recursive=payload.recursive,
             force=payload.force or not ready,
@@ -50,128 +85,215 @@ def initialize_dataset(payload: InitRequest) -> Dict[str, Any]:
             tile_size=payload.tile_size,
             tiles_dir=payload.tiles_dir,
             converter=payload.converter,
+            direct_tiles=payload.direct_tiles,
+            stream_tiles=payload.stream_tiles,
         )
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    except RuntimeError as exc:
-        detail = exc.args[1] if len(exc.args) > 1 else str(exc)
-        raise HTTPException(status_code=500, detail=detail) from exc
-    except Exception as exc:  # pragma: no cover - surface error
-        raise HTTPException(status_code=500, detail=str(exc)) from exc
 
-    manifests = result.get("manifests", dataset.list_manifests(data_path))
-    return {
-        "status": "ok",
-        "stdout": result.get("stdout"),
-        "stderr": result.get("stderr"),
-        "manifests": manifests,
-    }
+    def events() -> Iterator[bytes]:
+        # Newline-delimited JSON: one {"line": ...} per converter line, then a final status.
+        try:
+            for line in dataset.stream_converter(options):
+                yield _ndjson({"line": line})
+        except RuntimeError as exc:
+            detail = exc.args[1] if len(exc.args) > 1 else str(exc)
+            yield _ndjson({"status": "error", "detail": detail})
+            return
+        except Exception as exc:  # pragma: no cover - surface error
+            yield _ndjson({"status": "error", "detail": str(exc)})
+            return
+        yield _ndjson({"status": "ok", "manifests": dataset.rebuild_scene_index(data_path)})
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
+def _ndjson(event: Dict[str, Any]) -> bytes:
+    return dumps(event) + b"\n"
 
 
 @router.get("/images")
-def list_images() -> Dict[str, Any]:
-    manifests = dataset.list_manifests()
+async def list_images() -> Dict[str, Any]:
+    manifests = await run_in_threadpool(dataset.list_manifests)
     return {"count": len(manifests), "items": manifests}
 
 
 @router.get("/images/{scene_id}")
-def get_image(scene_id: str) -> Dict[str, Any]:
-    manifest = dataset.load_manifest_for_scene(scene_id)
+async def get_image(scene_id: str) -> Dict[str, Any]:
+    manifest = await run_in_threadpool(dataset.load_manifest_for_scene, scene_id)
     if not manifest:
         raise HTTPException(status_code=404, detail="Scene not found")
     return manifest
 
 
 @router.get("/images/{scene_id}/tiles/{row}/{col}")
-def get_tile(scene_id: str, row: int, col: int):
-    manifest = dataset.load_manifest_for_scene(scene_id)
-    if not manifest:
+async def get_tile(scene_id: str, row: int, col: int, request: Request):
+    target, stat = await run_in_threadpool(_resolve_tile, scene_id, row, col)
+    media_type = TILE_MEDIA_TYPES.get(target.suffix.lower())
+    headers = _cache_headers(stat)
+    if _not_modified(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    if TILES_ACCEL_PREFIX:
+        try:
+            relative = target.relative_to(dataset.DATA_ROOT)
+        except ValueError:
+            pass
+        else:
+            headers["X-Accel-Redirect"] = TILES_ACCEL_PREFIX.rstrip("/") + "/" + relative.as_posix()
+            return Response(headers=headers, media_type=media_type)
+    return FileResponse(target, stat_result=stat, media_type=media_type, headers=headers)
+
+
+def _resolve_tile(scene_id: str, row: int, col: int) -> Tuple[Path, os.stat_result]:
+    tiles = dataset.load_tile_lookup(scene_id)
+    if not tiles:
         raise HTTPException(status_code=404, detail="Scene not found")
-    tiles_root = Path(manifest.get("tiles_root_path"))
-    target = next(
-        (
-            tiles_root / tile.get("path")
-            for tile in manifest.get("tiles", [])
-            if tile.get("row") == row and tile.get("col") == col
-        ),
-        None,
-    )
-    if not target or not target.exists():
+    tiles_root, tile_lookup = tiles
+    tile_path = tile_lookup.get((row, col))
+    if not tile_path:
         raise HTTPException(status_code=404, detail="Tile not found")
-    return FileResponse(target)
+    target = tiles_root / tile_path
+    try:
+        return target, target.stat()
+    except OSError:
+        raise HTTPException(status_code=404, detail="Tile not found") from None
 
 
 @router.get("/images/{scene_id}/crop")
 def crop_scene(
     scene_id: str,
-    min_lat: float = Query(...),
-    min_lon: float = Query(...),
-    max_lat: float = Query(...),
-    max_lon: float = Query(...),
-    background_tasks: BackgroundTasks = None,
-) -> FileResponse:
+    background_tasks: BackgroundTasks,
+    bbox: Annotated[BBox, Query()],
+):
     manifest = dataset.load_manifest_for_scene(scene_id)
     if not manifest:
         raise HTTPException(status_code=404, detail="Scene not found")
     manifest_path = Path(manifest["manifest_path"])
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as temp:
-        temp_path = Path(temp.name)
-    try:
-        dataset.crop_by_latlon(
+    key = jobs.result_key(
+        "crop",
+        scene_id,
+        bbox.min_lat,
+        bbox.min_lon,
+        bbox.max_lat,
+        bbox.max_lon,
+        _manifest_mtime(manifest_path),
+    )
+
+    def render(output_path: Path) -> "Future[None]":
+        return dataset.crop_by_latlon(
             dataset.CropRequest(
                 manifest_path=manifest_path,
-                min_lat=min_lat,
-                min_lon=min_lon,
-                max_lat=max_lat,
-                max_lon=max_lon,
-                output_path=temp_path,
+                min_lat=bbox.min_lat,
+                min_lon=bbox.min_lon,
+                max_lat=bbox.max_lat,
+                max_lon=bbox.max_lon,
+                output_path=output_path,
             )
         )
-    except ValueError as exc:
-        temp_path.unlink(missing_ok=True)
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    if background_tasks is None:
-        background_tasks = BackgroundTasks()
-    background_tasks.add_task(_safe_unlink, temp_path)
-    return FileResponse(temp_path, filename=f"{scene_id}_crop.png", background=background_tasks)
+
+    return _serve_job(key, ".png", f"{scene_id}_crop.png", render, background_tasks)
 
 
 @router.get("/images/{scene_id}/full")
-def download_full(scene_id: str, background_tasks: BackgroundTasks = None) -> FileResponse:
+def download_full(scene_id: str, background_tasks: BackgroundTasks):
     manifest = dataset.load_manifest_for_scene(scene_id)
     if not manifest:
         raise HTTPException(status_code=404, detail="Scene not found")
     manifest_path = Path(manifest["manifest_path"])
-    with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as temp:
-        temp_path = Path(temp.name)
-    dataset.stitch_full_scene(manifest_path, temp_path)
-    if background_tasks is None:
-        background_tasks = BackgroundTasks()
-    background_tasks.add_task(_safe_unlink, temp_path)
-    return FileResponse(temp_path, filename=f"{scene_id}_full.jpg", background=background_tasks)
+    key = jobs.result_key("full", scene_id, _manifest_mtime(manifest_path))
+
+    def render(output_path: Path) -> "Future[None]":
+        return dataset.stitch_full_scene(manifest_path, output_path)
+
+    return _serve_job(key, ".jpg", f"{scene_id}_full.jpg", render, background_tasks)
+
+
+def _manifest_mtime(manifest_path: Path) -> int:
+    try:
+        return manifest_path.stat().st_mtime_ns
+    except OSError:
+        # Removed or renamed since the lookup.
+        raise HTTPException(status_code=404, detail="Scene not found") from None
+
+
+@router.get("/jobs/{job_id}")
+def get_job(job_id: str):
+    job = jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status == "error":
+        raise HTTPException(status_code=job.status_code, detail=job.error)
+    if job.status != "done":
+        return _job_status(job)
+    return FileResponse(job.output_path, filename=job.filename)
+
+
+def _serve_job(
+    key: str,
+    suffix: str,
+    filename: str,
+    render: Callable[[Path], "Future[None]"],
+    background_tasks: BackgroundTasks,
+):
+    """Return a cached render, or queue it and answer 202 with a job to poll."""
+
+    cached = jobs.cached_result(key, suffix)
+    if cached is not None:
+        return FileResponse(cached, filename=filename)
+    job, created = jobs.submit(key, jobs.result_path(key, suffix), filename)
+    if created:
+        background_tasks.add_task(jobs.run, job, render)
+    return _job_status(job)
+
+
+def _job_status(job: jobs.Job) -> FastJSONResponse:
+    return FastJSONResponse(
+        status_code=202,
+        content={"job_id": job.job_id, "status": job.status, "url": f"{router.prefix}/jobs/{job.job_id}"},
+    )
 
 
 @router.get("/images/{scene_id}/preview")
-def download_preview(scene_id: str) -> FileResponse:
+async def download_preview(scene_id: str, request: Request) -> Response:
+    preview_path, stat = await run_in_threadpool(_resolve_preview, scene_id)
+    headers = _cache_headers(stat)
+    if _not_modified(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(preview_path, stat_result=stat, headers=headers)
+
+
+def _resolve_preview(scene_id: str) -> Tuple[Path, os.stat_result]:
     manifest = dataset.load_manifest_for_scene(scene_id)
     if not manifest:
         raise HTTPException(status_code=404, detail="Scene not found")
     preview_path = dataset.resolve_preview_path(manifest)
     if not preview_path:
         raise HTTPException(status_code=404, detail="Preview not available for this scene")
-    return FileResponse(preview_path)
+    try:
+        return preview_path, preview_path.stat()
+    except OSError:
+        raise HTTPException(status_code=404, detail="Preview not available for this scene") from None
 
 
-def _safe_unlink(path: Path) -> None:  # pragma: no cover - best effort cleanup
-    try:
-        path.unlink(missing_ok=True)
-    except Exception:
-        pass
+def _file_etag(stat: os.stat_result) -> str:
+    return f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+
+
+def _cache_headers(stat: os.stat_result) -> Dict[str, str]:
+    return {"ETag": _file_etag(stat), "Cache-Control": TILE_CACHE_CONTROL}
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {token.strip().removeprefix("W/") for token in header.split(",")}
+    return "*" in candidates or etag in candidates
 
 
 @router.get("/search")
-def search_index(q: str, limit: int = 20) -> Dict[str, Any]:
+def search_index(q: str, limit: int = 20) -> FastJSONResponse:
     try:
-        return search.search(q, limit=limit)
+        return FastJSONResponse(search.search(q, limit=limit))
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
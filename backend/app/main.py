@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import os
+from importlib.util import find_spec
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from .api.responses import FastJSONResponse
 from .api.routes import router as api_router
+from .services import dataset
 
 
 def create_app() -> FastAPI:
@@ -11,14 +16,18 @@ def create_app() -> FastAPI:
         title="Mars Imagery Explorer",
         version="0.1.0",
         description="API for processing and serving HiRISE imagery tiles",
+        default_response_class=FastJSONResponse,
     )
 
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        # Credentials cannot be combined with a wildcard origin anyway.
+        allow_credentials=False,
+        allow_methods=["GET", "POST"],
+        allow_headers=["Accept", "Content-Type", "If-None-Match", "Range"],
+        # Let browsers cache preflight responses for a day.
+        max_age=86400,
     )
 
     app.include_router(api_router)
@@ -28,7 +37,36 @@ def create_app() -> FastAPI:
 app = create_app()
 
 
-if __name__ == "__main__":  # pragma: no cover
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def run_server() -> None:
+    """Serve the app with uvloop/httptools and one worker per CPU.
+
+    Set `RELOAD=1` for a single auto-reloading development worker.
+    """
+
     import uvicorn
 
-    uvicorn.run("backend.app.main:app", host="0.0.0.0", port=8000, reload=True)
+    # Index the data tree once here, before the workers start, rather than
+    # having every worker rewrite the same SQLite file at import. Workers (and
+    # servers started through the uvicorn CLI) fill in misses lazily.
+    dataset.rebuild_scene_index()
+    reload = os.environ.get("RELOAD", "").lower() in {"1", "true", "yes"}
+    uvicorn.run(
+        "backend.app.main:app",
+        host=os.environ.get("HOST", "0.0.0.0"),
+        port=_env_int("PORT", 8000),
+        loop="uvloop" if find_spec("uvloop") else "asyncio",
+        http="httptools" if find_spec("httptools") else "h11",
+        workers=1 if reload else _env_int("WEB_CONCURRENCY", os.cpu_count() or 1),
+        reload=reload,
+    )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    run_server()
@@ -1,18 +1,72 @@
 from __future__ import annotations
 
 import json
-import subprocess
-import sys
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    from rtree import index as rtree_index
+except ImportError:  # pragma: no cover - optional dependency
+    rtree_index = None
 
 from ..utils import restitcher
 from ..utils.converter import iter_jp2_files, parse_scene_name
+from ..utils.converter import run as convert_dataset
 
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
 DATA_ROOT = PROJECT_ROOT / "data"
-CONVERTER_SCRIPT = PROJECT_ROOT / "backend" / "app" / "utils" / "converter.py"
+MANIFEST_NAME = "metadata.json"
+CACHE_DIRNAME = ".cache"
+SCENE_INDEX_NAME = "scene_index.sqlite3"
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _CachedManifest:
+    mtime_ns: int
+    data: Dict[str, Any]
+    tile_lookup: Dict[Tuple[int, int], str]
+    tiles_count: int
+    tile_rows: int
+    tile_cols: int
+    # Per-tile (min_lat, max_lat, west_lon, east_lon), or None without projection metadata.
+    tile_bboxes: Optional[np.ndarray] = None
+    # R-tree over `tile_bboxes`, built on the first crop when `rtree` is installed.
+    tile_rtree: Any = None
+
+
+# Parsed manifests keyed by path, invalidated when the file's mtime changes.
+_MANIFEST_CACHE: Dict[Path, _CachedManifest] = {}
+# In-process copy of the persisted scene index: data root -> scene_id -> manifest
+# path. Lookups are served from here; SQLite is read only when a scene is missing.
+_SCENE_INDEX: Dict[Path, Dict[str, Path]] = {}
+# A lookup miss rebuilds the index, at most once per this many seconds per data
+# root, so requests for unknown scenes cannot keep re-walking the tree.
+SCENE_INDEX_REFRESH_SECONDS = 5.0
+_SCENE_INDEX_WALKED: Dict[Path, float] = {}
+# Shared pool for stat + read + parse of manifests during a catalogue walk.
+_PARSE_POOL = ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 1), thread_name_prefix="manifest")
 
 
 def resolve_data_path(path: Optional[str]) -> Path:
@@ -39,7 +93,7 @@ def manifests_ready(manifests: List[Dict[str, Any]]) -> bool:
     return True
 
 
-def run_converter(
+def build_converter_options(
     data_path: Path = DATA_ROOT,
     recursive: bool = True,
     force: bool = False,
@@ -48,8 +102,10 @@ def run_converter(
     tile_size: int = 2048,
     tiles_dir: str = "tiles",
     converter: Optional[str] = None,
-) -> Dict[str, Any]:
-    """Invoke the converter CLI to process JP2 files into tiles."""
+    direct_tiles: bool = False,
+    stream_tiles: bool = False,
+) -> Tuple[Dict[str, Any], int]:
+    """Validate the inputs and return `converter.run` keyword arguments plus the JP2 count."""
 
     if not data_path.exists():
         raise FileNotFoundError(f"Data path does not exist: {data_path}")
@@ -60,69 +116,122 @@ def run_converter(
             f"No JP2 files found under {data_path}. Download HiRISE scenes first."
         )
 
-    cmd = [
-        sys.executable,
-        str(CONVERTER_SCRIPT),
-        str(data_path),
-    ]
-
-    if recursive:
-        cmd.append("--recursive")
-    if force:
-        cmd.append("--force")
-    if converter:
-        cmd.extend(["--converter", converter])
-
-    cmd.extend(["--format", output_format])
-    cmd.extend(["--tile-size", str(tile_size)])
-    cmd.extend(["--tiles-dir", tiles_dir])
-    if quality is not None:
-        cmd.extend(["--quality", str(quality)])
-
-    result = subprocess.run(
-        cmd,
-        cwd=str(PROJECT_ROOT),
-        capture_output=True,
-        text=True,
-        check=False,
+    options: Dict[str, Any] = {
+        "path": data_path,
+        "recursive": recursive,
+        "force": force,
+        "converter": converter,
+        "direct_tiles": direct_tiles,
+        "stream_tiles": stream_tiles,
+        "output_format": output_format,
+        "quality": quality,
+        "tile_size": tile_size,
+        "tiles_dir": tiles_dir,
+    }
+    return options, len(jp2_files)
+
+
+def stream_converter(options: Dict[str, Any]) -> Iterator[str]:
+    """Run the converter in-process, yielding its log one line at a time.
+
+    The conversion runs on a worker thread so lines are available as soon as
+    they are logged. Raises `RuntimeError` after the last line if the
+    converter reports a non-zero exit code.
+    """
+
+    lines: "queue.Queue[Optional[str]]" = queue.Queue()
+    outcome: Dict[str, int] = {"returncode": 1}
+
+    def work() -> None:
+        try:
+            outcome.update(convert_dataset(log=lines.put, **options))
+        except Exception as exc:  # pragma: no cover - surface error
+            lines.put(f"❌ {exc}")
+        finally:
+            lines.put(None)
+
+    threading.Thread(target=work, name="converter", daemon=True).start()
+    while True:
+        message = lines.get()
+        if message is None:
+            break
+        yield from message.splitlines()
+    if outcome["returncode"] != 0:
+        raise RuntimeError("Converter command failed", outcome)
+
+
+def run_converter(
+    data_path: Path = DATA_ROOT,
+    recursive: bool = True,
+    force: bool = False,
+    output_format: str = "jpg",
+    quality: int = 85,
+    tile_size: int = 2048,
+    tiles_dir: str = "tiles",
+    converter: Optional[str] = None,
+    direct_tiles: bool = False,
+    stream_tiles: bool = False,
+) -> Dict[str, Any]:
+    """Run the converter in-process to turn JP2 files into tiles."""
+
+    options, jp2_count = build_converter_options(
+        data_path=data_path,
+        recursive=recursive,
+        force=force,
+        output_format=output_format,
+        quality=quality,
+        tile_size=tile_size,
+        tiles_dir=tiles_dir,
+        converter=converter,
+        direct_tiles=direct_tiles,
+        stream_tiles=stream_tiles,
     )
 
+    lines: List[str] = []
     payload: Dict[str, Any] = {
-        "command": cmd,
-        "returncode": result.returncode,
-        "stdout": result.stdout,
-        "stderr": result.stderr,
-        "jp2_count": len(jp2_files),
+        "returncode": 0,
+        "jp2_count": jp2_count,
     }
+    try:
+        for line in stream_converter(options):
+            lines.append(line)
+    except RuntimeError as exc:
+        payload.update(exc.args[1])
+        payload["stdout"] = "\n".join(lines)
+        raise RuntimeError("Converter command failed", payload) from exc
+    payload["stdout"] = "\n".join(lines)
+
+    payload["manifests"] = rebuild_scene_index(data_path)
+    return payload
 
-    if result.returncode != 0:
-        raise RuntimeError(
-            "Converter command failed",
-            payload,
-        )
 
-    payload["manifests"] = list_manifests(data_path)
-    return payload
+def rebuild_scene_index(data_path: Path = DATA_ROOT) -> List[Dict[str, Any]]:
+    """Walk *data_path* and persist the scene → manifest index, returning the manifests."""
+
+    return list_manifests(data_path)
 
 
 def list_manifests(data_path: Path = DATA_ROOT) -> List[Dict[str, Any]]:
+    """Return the best manifest per scene; the walk also refreshes the scene index."""
+
     best_by_scene: Dict[str, Dict[str, Any]] = {}
     orphans: List[Dict[str, Any]] = []
-    for manifest_path in sorted(data_path.rglob("metadata.json")):
-        try:
-            data = json.loads(manifest_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
+    paths = sorted(_iter_manifest_paths(data_path))
+    loaded = _PARSE_POOL.map(_load_cached, paths) if len(paths) > 1 else map(_load_cached, paths)
+    for manifest_path, cached in zip(paths, loaded):
+        if cached is None:
             continue
+        data = dict(cached.data)
         data["manifest_path"] = str(manifest_path)
         data["tiles_root_path"] = str(manifest_path.parent)
-        data["tiles_count"] = len(data.get("tiles", []))
-        data["tile_rows"] = max((t.get("row", 0) for t in data.get("tiles", [])), default=-1) + 1
-        data["tile_cols"] = max((t.get("col", 0) for t in data.get("tiles", [])), default=-1) + 1
+        data["tiles_count"] = cached.tiles_count
+        data["tile_rows"] = cached.tile_rows
+        data["tile_cols"] = cached.tile_cols
         data["bounds"] = compute_bounds_from_manifest(data)
-        scene_info = parse_scene_name(Path(data.get("source", manifest_path.stem)))
+        scene_info = _scene_info(data.get("source", manifest_path.stem))
         for key, value in scene_info.items():
             data.setdefault(key, value)
-        data["preview_available"] = bool(resolve_preview_path(data, data_path))
+        data["preview_available"] = _preview_available(cached.data, data_path)
 
         scene_id = data.get("scene_id")
         if not scene_id:
@@ -134,33 +243,276 @@ def list_manifests(data_path: Path = DATA_ROOT) -> List[Dict[str, Any]]:
             best_by_scene[scene_id] = data
 
     ordered = sorted(best_by_scene.values(), key=lambda item: item.get("scene_id", ""))
+    _store_scene_index(data_path, ordered)
     return ordered + orphans
 
 
 def load_manifest_for_scene(scene_id: str, data_path: Path = DATA_ROOT) -> Optional[Dict[str, Any]]:
-    best: Optional[Dict[str, Any]] = None
-    best_score: Optional[tuple] = None
-    for manifest_path in sorted(data_path.rglob("metadata.json")):
+    """Load a scene through the index, rebuilding it once if the scene is missing or moved."""
+
+    for refreshed in (False, True):
+        manifest_path = _lookup_scene_index(scene_id, data_path)
+        data = _load_scene_manifest(manifest_path, data_path) if manifest_path else None
+        if data is not None and data.get("scene_id") == scene_id:
+            return data
+        if refreshed or not _refresh_scene_index(data_path):
+            break
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _scene_info(source: str) -> Mapping[str, Any]:
+    """Memoized, read-only `parse_scene_name` keyed by the manifest's source name."""
+
+    return MappingProxyType(parse_scene_name(Path(source)))
+
+
+def _load_scene_manifest(manifest_path: Path, data_path: Path) -> Optional[Dict[str, Any]]:
+    cached = _load_cached(manifest_path)
+    if cached is None:
+        return None
+    data = dict(cached.data)
+    info = _scene_info(data.get("source", manifest_path.stem))
+    data.setdefault("manifest_path", str(manifest_path))
+    data.setdefault("tiles_root_path", str(manifest_path.parent))
+    data.setdefault("tile_rows", cached.tile_rows)
+    data.setdefault("tile_cols", cached.tile_cols)
+    data.setdefault("tiles_count", cached.tiles_count)
+    data["bounds"] = data.get("bounds") or compute_bounds_from_manifest(data)
+    data.update(info)
+    data["preview_available"] = _preview_available(cached.data, data_path)
+    return data
+
+
+def _preview_available(manifest: Dict[str, Any], data_path: Path) -> bool:
+    """Stat the preview on every call: images can be added or removed without touching the manifest."""
+
+    output_path = manifest.get("output_path")
+    return bool(output_path) and os.path.exists(os.path.join(data_path, output_path))
+
+
+def load_tile_lookup(
+    scene_id: str, data_path: Path = DATA_ROOT
+) -> Optional[Tuple[Path, Dict[Tuple[int, int], str]]]:
+    """Return the tiles directory and `(row, col)` → tile path map for a scene."""
+
+    for refreshed in (False, True):
+        manifest_path = _lookup_scene_index(scene_id, data_path)
+        cached = _load_cached(manifest_path) if manifest_path else None
+        if cached is not None:
+            return manifest_path.parent, cached.tile_lookup
+        if refreshed or not _refresh_scene_index(data_path):
+            break
+    return None
+
+
+def _refresh_scene_index(data_path: Path) -> bool:
+    """Re-walk *data_path* after a lookup miss unless it was walked recently; True if it ran."""
+
+    last = _SCENE_INDEX_WALKED.get(data_path)
+    if last is not None and time.monotonic() - last < SCENE_INDEX_REFRESH_SECONDS:
+        return False
+    list_manifests(data_path)
+    return True
+
+
+def _scene_index_path(data_path: Path) -> Path:
+    return data_path / CACHE_DIRNAME / SCENE_INDEX_NAME
+
+
+def _connect_scene_index(index_path: Path) -> sqlite3.Connection:
+    # Other server workers may be writing; wait for their lock rather than fail.
+    conn = sqlite3.connect(str(index_path), timeout=10.0)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS scenes ("
+        "scene_id TEXT PRIMARY KEY, manifest_path TEXT NOT NULL, mtime INTEGER NOT NULL)"
+    )
+    return conn
+
+
+def _read_scene_rows(index_path: Path) -> Dict[str, Tuple[str, int]]:
+    """Return the persisted `scene_id -> (manifest_path, mtime_ns)` rows, without creating the file."""
+
+    if not index_path.exists():
+        return {}
+    try:
+        with closing(sqlite3.connect(f"{index_path.as_uri()}?mode=ro", uri=True, timeout=10.0)) as conn:
+            rows = conn.execute("SELECT scene_id, manifest_path, mtime FROM scenes").fetchall()
+    except sqlite3.Error as exc:
+        logger.warning("Could not read scene index %s: %s", index_path, exc)
+        return {}
+    return {scene_id: (manifest_path, mtime) for scene_id, manifest_path, mtime in rows}
+
+
+def _store_scene_index(data_path: Path, manifests: List[Dict[str, Any]]) -> None:
+    """Write the rows that differ from the persisted index; an unchanged catalogue writes nothing."""
+
+    _SCENE_INDEX_WALKED[data_path] = time.monotonic()
+    if not data_path.is_dir():
+        return
+    rows: Dict[str, Tuple[str, int]] = {}
+    for manifest in manifests:
+        manifest_path = Path(manifest["manifest_path"])
+        cached = _MANIFEST_CACHE.get(manifest_path)
+        rows[manifest["scene_id"]] = (str(manifest_path), cached.mtime_ns if cached else 0)
+    _SCENE_INDEX[data_path] = {scene_id: Path(row[0]) for scene_id, row in rows.items()}
+    index_path = _scene_index_path(data_path)
+    stored = _read_scene_rows(index_path)
+    changed = [(scene_id, *row) for scene_id, row in rows.items() if stored.get(scene_id) != row]
+    removed = [(scene_id,) for scene_id in stored.keys() - rows.keys()]
+    if not changed and not removed:
+        return
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(_connect_scene_index(index_path)) as conn, conn:
+            conn.executemany(
+                "INSERT INTO scenes VALUES (?, ?, ?) ON CONFLICT(scene_id) DO UPDATE "
+                "SET manifest_path = excluded.manifest_path, mtime = excluded.mtime",
+                changed,
+            )
+            conn.executemany("DELETE FROM scenes WHERE scene_id = ?", removed)
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning("Could not update scene index %s: %s", index_path, exc)
+
+
+def _lookup_scene_index(scene_id: str, data_path: Path) -> Optional[Path]:
+    scenes = _SCENE_INDEX.get(data_path, {})
+    manifest_path = scenes.get(scene_id)
+    if manifest_path is not None:
+        return manifest_path
+    # Another worker (or an earlier run) may have indexed the scene since this
+    # map was filled, so fall back to the persisted copy.
+    stored = _read_scene_rows(_scene_index_path(data_path))
+    scenes = {**scenes, **{scene_id: Path(row[0]) for scene_id, row in stored.items()}}
+    _SCENE_INDEX[data_path] = scenes
+    return scenes.get(scene_id)
+
+
+def _iter_manifest_paths(data_path: Path) -> Iterator[Path]:
+    """Yield every manifest beneath *data_path* using `os.scandir`.
+
+    Hidden directories (including the `.cache` written by this module) are
+    skipped. A directory holding a manifest is a tile set, so its manifest is
+    yielded without listing the thousands of tiles next to it.
+    """
+
+    root = str(data_path)
+    root_manifest = os.path.join(root, MANIFEST_NAME)
+    if os.path.isfile(root_manifest):
+        yield Path(root_manifest)
+        return
+    pending = [root]
+    while pending:
         try:
-            data = json.loads(manifest_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            continue
-        info = parse_scene_name(Path(data.get("source", manifest_path.stem)))
-        if info.get("scene_id") != scene_id:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.name.startswith(".") or not entry.is_dir(follow_symlinks=False):
+                        continue
+                    manifest = os.path.join(entry.path, MANIFEST_NAME)
+                    if os.path.isfile(manifest):
+                        yield Path(manifest)
+                    else:
+                        pending.append(entry.path)
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
             continue
-        data.setdefault("manifest_path", str(manifest_path))
-        data.setdefault("tiles_root_path", str(manifest_path.parent))
-        data.setdefault("tile_rows", max((t.get("row", 0) for t in data.get("tiles", [])), default=-1) + 1)
-        data.setdefault("tile_cols", max((t.get("col", 0) for t in data.get("tiles", [])), default=-1) + 1)
-        data.setdefault("tiles_count", len(data.get("tiles", [])))
-        data["bounds"] = data.get("bounds") or compute_bounds_from_manifest(data)
-        data.update(info)
-        data["preview_available"] = bool(resolve_preview_path(data, data_path))
-        score = _manifest_score(data)
-        if best is None or best_score is None or score > best_score:
-            best = data
-            best_score = score
-    return best
+
+
+def _load_cached(path: Path) -> Optional[_CachedManifest]:
+    """Return the parsed manifest at *path*, re-reading it only when its mtime changes.
+
+    The cached `data` dict is shared between callers and must not be mutated.
+    """
+
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        _MANIFEST_CACHE.pop(path, None)
+        return None
+    cached = _MANIFEST_CACHE.get(path)
+    if cached is not None and cached.mtime_ns == mtime_ns:
+        return cached
+    try:
+        data = _loads(path.read_bytes())
+    except (OSError, json.JSONDecodeError):
+        return None
+    # Single pass over the tiles for the lookup table and grid dimensions.
+    tile_lookup: Dict[Tuple[int, int], str] = {}
+    count = 0
+    max_row = max_col = -1
+    for tile in data.get("tiles", ()):
+        count += 1
+        row = tile.get("row", 0)
+        col = tile.get("col", 0)
+        if row > max_row:
+            max_row = row
+        if col > max_col:
+            max_col = col
+        tile_lookup[(tile.get("row"), tile.get("col"))] = tile.get("path")
+    cached = _CachedManifest(
+        mtime_ns=mtime_ns,
+        data=data,
+        tile_lookup=tile_lookup,
+        tiles_count=count,
+        tile_rows=max_row + 1,
+        tile_cols=max_col + 1,
+        tile_bboxes=_tile_bboxes(data),
+    )
+    _MANIFEST_CACHE[path] = cached
+    return cached
+
+
+def _tile_bboxes(manifest: Dict[str, Any]) -> Optional[np.ndarray]:
+    """Project every tile's pixel rectangle onto the scene's lat/lon extent."""
+
+    bounds = compute_bounds_from_manifest(manifest)
+    tiles = manifest.get("tiles")
+    size = manifest.get("image_size") or {}
+    width, height = size.get("width"), size.get("height")
+    if not bounds or not tiles or not width or not height:
+        return None
+    try:
+        px = np.array([(t["x"], t["y"], t["width"], t["height"]) for t in tiles], dtype=np.float64)
+    except (KeyError, TypeError, ValueError):
+        return None
+    north = max(bounds["min_lat"], bounds["max_lat"])
+    lat_span = north - min(bounds["min_lat"], bounds["max_lat"])
+    lon_span = bounds["east_lon"] - bounds["west_lon"]
+    if lat_span <= 0 or lon_span <= 0:
+        # An empty or inverted extent would give inverted boxes that match no
+        # crop; skip the prefilter so the restitcher rejects it as usual.
+        return None
+    x, y, w, h = px.T
+    return np.column_stack(
+        (
+            north - (y + h) / height * lat_span,
+            north - y / height * lat_span,
+            bounds["west_lon"] + x / width * lon_span,
+            bounds["west_lon"] + (x + w) / width * lon_span,
+        )
+    )
+
+
+def _select_tiles(
+    cached: _CachedManifest, min_lat: float, min_lon: float, max_lat: float, max_lon: float
+) -> np.ndarray:
+    """Return indices of tiles whose lat/lon box overlaps the query box."""
+
+    bboxes = cached.tile_bboxes
+    if rtree_index is not None:
+        if cached.tile_rtree is None:
+            cached.tile_rtree = rtree_index.Index(
+                (i, (west, south, east, north), None)
+                for i, (south, north, west, east) in enumerate(bboxes.tolist())
+            )
+        hits = cached.tile_rtree.intersection((min_lon, min_lat, max_lon, max_lat))
+        return np.sort(np.fromiter(hits, dtype=np.int64))
+    mask = (
+        (bboxes[:, 0] <= max_lat)
+        & (bboxes[:, 1] >= min_lat)
+        & (bboxes[:, 2] <= max_lon)
+        & (bboxes[:, 3] >= min_lon)
+    )
+    return np.flatnonzero(mask)
 
 
 def resolve_preview_path(manifest: Dict[str, Any], data_path: Path = DATA_ROOT) -> Optional[Path]:
@@ -173,25 +525,37 @@ def resolve_preview_path(manifest: Dict[str, Any], data_path: Path = DATA_ROOT)
     return candidate if candidate.exists() else None
 
 
+_BOUNDS_KEYS = (
+    ("min_lat", "MINIMUM_LATITUDE"),
+    ("max_lat", "MAXIMUM_LATITUDE"),
+    ("west_lon", "WESTERNMOST_LONGITUDE"),
+    ("east_lon", "EASTERNMOST_LONGITUDE"),
+)
+
+
 def compute_bounds_from_manifest(manifest: Dict[str, Any]) -> Optional[Dict[str, float]]:
-    projection = manifest.get("label_metadata", {}).get("projection") if manifest.get("label_metadata") else None
+    label_metadata = manifest.get("label_metadata")
+    projection = label_metadata.get("projection") if label_metadata else None
     if not projection:
         return None
-    try:
-        min_lat = _coerce_float(projection.get("MINIMUM_LATITUDE"))
-        max_lat = _coerce_float(projection.get("MAXIMUM_LATITUDE"))
-        west_lon = _coerce_float(projection.get("WESTERNMOST_LONGITUDE"))
-        east_lon = _coerce_float(projection.get("EASTERNMOST_LONGITUDE"))
-    except (TypeError, ValueError):
-        return None
-    if None in (min_lat, max_lat, west_lon, east_lon):
-        return None
-    return {
-        "min_lat": min_lat,
-        "max_lat": max_lat,
-        "west_lon": west_lon,
-        "east_lon": east_lon,
-    }
+    bounds: Dict[str, float] = {}
+    for name, key in _BOUNDS_KEYS:
+        value = projection.get(key)
+        if isinstance(value, dict):
+            value = value.get("value")
+        if value is None:
+            return None
+        if isinstance(value, (int, float, str)):
+            try:
+                bounds[name] = float(value)
+            except ValueError:
+                return None
+        else:
+            coerced = _coerce_float(value)
+            if coerced is None:
+                return None
+            bounds[name] = coerced
+    return bounds
 
 
 def _coerce_float(value: Any) -> Optional[float]:
@@ -235,30 +599,60 @@ class CropRequest:
     output_path: Path
 
 
-def crop_by_latlon(request: CropRequest) -> Path:
-    manifest = json.loads(request.manifest_path.read_text(encoding="utf-8"))
-    restitcher.crop_by_latlon(
+def crop_by_latlon(request: CropRequest) -> "Future[None]":
+    """Render the crop; the returned future resolves once the image is written."""
+
+    cached = _load_cached(request.manifest_path)
+    if cached is None:
+        raise FileNotFoundError(f"Manifest not found: {request.manifest_path}")
+    manifest = cached.data
+    if cached.tile_bboxes is not None and len(cached.tile_bboxes):
+        # Hand the restitcher only the tiles the crop can touch, padded by a
+        # pixel so its floor/ceil rounding never reaches an excluded tile.
+        size = manifest["image_size"]
+        west, east = cached.tile_bboxes[:, 2].min(), cached.tile_bboxes[:, 3].max()
+        pad_lat = (cached.tile_bboxes[:, 1].max() - cached.tile_bboxes[:, 0].min()) / size["height"]
+        pad_lon = (east - west) / size["width"]
+        # Match the restitcher, which accepts either longitude convention.
+        center_lon = (west + east) / 2
+        min_lon = restitcher.wrap_longitude(request.min_lon, center_lon)
+        max_lon = restitcher.wrap_longitude(request.max_lon, center_lon)
+        selected = _select_tiles(
+            cached,
+            min(request.min_lat, request.max_lat) - pad_lat,
+            min(min_lon, max_lon) - pad_lon,
+            max(request.min_lat, request.max_lat) + pad_lat,
+            max(min_lon, max_lon) + pad_lon,
+        )
+        tiles = manifest["tiles"]
+        manifest = dict(manifest, tiles=[tiles[i] for i in selected])
+    return restitcher.crop_by_latlon(
         manifest,
         request.manifest_path,
         (request.min_lat, request.min_lon, request.max_lat, request.max_lon),
         request.output_path,
     )
-    return request.output_path
 
 
-def stitch_full_scene(manifest_path: Path, output_path: Path) -> Path:
-    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
-    restitcher.stitch_full(manifest, manifest_path, output_path)
-    return output_path
+def stitch_full_scene(manifest_path: Path, output_path: Path) -> "Future[None]":
+    # The cached dict keeps its tile list, so the restitcher's index and paths are reused.
+    cached = _load_cached(manifest_path)
+    if cached is None:
+        raise FileNotFoundError(f"Manifest not found: {manifest_path}")
+    return restitcher.stitch_full(cached.data, manifest_path, output_path)
 
 
 __all__ = [
     "resolve_data_path",
     "find_jp2_files",
     "manifests_ready",
+    "build_converter_options",
+    "stream_converter",
     "run_converter",
+    "rebuild_scene_index",
     "list_manifests",
     "load_manifest_for_scene",
+    "load_tile_lookup",
     "resolve_preview_path",
     "crop_by_latlon",
     "stitch_full_scene",
@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import string
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .dataset import CACHE_DIRNAME, DATA_ROOT
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+RESULTS_DIR = DATA_ROOT / CACHE_DIRNAME / "crops"
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+# Least recently used renders are evicted once the cache grows past this size.
+RESULTS_MAX_BYTES = _env_int("RESULTS_MAX_BYTES", 2 * 1024**3)
+# Finished jobs tracked in memory, oldest dropped first; their results stay
+# reachable through the disk fallback in `get`.
+MAX_TRACKED_JOBS = _env_int("MAX_TRACKED_JOBS", 1024)
+
+
+@dataclass
+class Job:
+    job_id: str
+    output_path: Path
+    filename: str
+    status: str = "pending"
+    error: Optional[str] = None
+    status_code: int = 500
+
+
+_JOBS: "OrderedDict[str, Job]" = OrderedDict()
+_LOCK = threading.Lock()
+
+
+def result_key(*parts: Any) -> str:
+    """Hash the inputs of a render into a stable job id / cache key."""
+
+    token = "|".join(str(part) for part in parts)
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def result_path(key: str, suffix: str) -> Path:
+    return RESULTS_DIR / f"{key}{suffix}"
+
+
+def cached_result(key: str, suffix: str) -> Optional[Path]:
+    """Return a finished render, bumping its mtime so eviction treats it as recent."""
+
+    path = result_path(key, suffix)
+    try:
+        os.utime(path)
+    except OSError:
+        return None
+    return path
+
+
+def submit(job_id: str, output_path: Path, filename: str) -> Tuple[Job, bool]:
+    """Register a job, returning `(job, created)`; live jobs with the same id are reused."""
+
+    with _LOCK:
+        job = _JOBS.get(job_id)
+        if job is not None and job.status != "error" and not _evicted(job):
+            _JOBS.move_to_end(job_id)
+            return job, False
+        job = Job(job_id=job_id, output_path=output_path, filename=filename)
+        _JOBS[job_id] = job
+        _JOBS.move_to_end(job_id)
+        _prune()
+        return job, True
+
+
+def _prune() -> None:
+    """Drop the oldest finished jobs beyond MAX_TRACKED_JOBS; the caller holds `_LOCK`."""
+
+    excess = len(_JOBS) - MAX_TRACKED_JOBS
+    if excess <= 0:
+        return
+    for job_id in [job_id for job_id, job in _JOBS.items() if job.status in ("done", "error")][:excess]:
+        del _JOBS[job_id]
+
+
+def _evicted(job: Job) -> bool:
+    """Whether *job* finished but its output has since been evicted or deleted."""
+
+    return job.status == "done" and not job.output_path.exists()
+
+
+def _forget(output_path: Path) -> None:
+    """Drop the tracked job whose result lives at *output_path*."""
+
+    job_id = output_path.name.split(".", 1)[0]
+    with _LOCK:
+        job = _JOBS.get(job_id)
+        if job is not None and job.output_path == output_path:
+            del _JOBS[job_id]
+
+
+def run(job: Job, work: Callable[[Path], Any]) -> None:
+    """Render into a partial file and move it into place once complete.
+
+    If *work* returns a Future (the file is still being encoded), the job is
+    finished from its callback instead of holding this thread until then.
+    """
+
+    job.status = "running"
+    partial = job.output_path.with_name(f"{job.output_path.stem}.partial{job.output_path.suffix}")
+    try:
+        partial.parent.mkdir(parents=True, exist_ok=True)
+        claim = _claim(partial)
+    except Exception as exc:
+        _fail(job, exc)
+        return
+    if claim is None:
+        # Another server worker is rendering this key; `get` follows its
+        # partial file and picks up the result once it is moved into place.
+        _forget(job.output_path)
+        return
+    if job.output_path.exists():
+        # The other worker finished between our cache check and the claim.
+        _finish(job, partial, None, claim, rendered=False)
+        return
+    try:
+        pending = work(partial)
+    except Exception as exc:
+        _finish(job, partial, exc, claim)
+        return
+    if isinstance(pending, Future):
+
+        def encoded(done: Future) -> None:
+            error = RuntimeError("Render was cancelled.") if done.cancelled() else done.exception()
+            _finish(job, partial, error, claim)
+
+        pending.add_done_callback(encoded)
+    else:
+        _finish(job, partial, None, claim)
+
+
+def _claim(partial: Path) -> Optional[int]:
+    """Lock *partial* for this render, returning its fd, or None if a live worker holds it.
+
+    The lock is held until the render finishes and is released by the kernel
+    if the worker dies, so a leftover partial file never blocks a new render.
+    """
+
+    while True:
+        fd = os.open(partial, os.O_CREAT | os.O_WRONLY, 0o644)
+        if fcntl is None:
+            return fd
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return None
+        except BaseException:
+            os.close(fd)
+            raise
+        try:
+            opened, current = os.fstat(fd), os.stat(partial)
+            if (opened.st_dev, opened.st_ino) == (current.st_dev, current.st_ino):
+                return fd
+        except FileNotFoundError:
+            pass
+        except BaseException:
+            os.close(fd)
+            raise
+        # The previous holder moved or removed the file after we opened it.
+        os.close(fd)
+
+
+def _claimed(partial: Path) -> bool:
+    """Whether a live worker holds the lock on *partial*."""
+
+    if fcntl is None:
+        return True
+    try:
+        fd = os.open(partial, os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return True
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+    return False
+
+
+def _finish(
+    job: Job,
+    partial: Path,
+    error: Optional[BaseException],
+    claim: int,
+    rendered: bool = True,
+) -> None:
+    try:
+        if error is None and rendered:
+            try:
+                os.replace(partial, job.output_path)
+            except Exception as exc:
+                error = exc
+        if error is not None or not rendered:
+            partial.unlink(missing_ok=True)
+    finally:
+        os.close(claim)
+    if error is None:
+        try:
+            evict(keep=job.output_path)
+        except Exception as exc:
+            error = exc
+    if error is not None:
+        _fail(job, error)
+    else:
+        job.status = "done"
+
+
+def _fail(job: Job, error: BaseException) -> None:
+    job.error = str(error)
+    job.status_code = 400 if isinstance(error, ValueError) else 500
+    job.status = "error"
+
+
+def evict(max_bytes: int = RESULTS_MAX_BYTES, keep: Optional[Path] = None) -> None:
+    """Delete the least recently used renders until the cache fits in *max_bytes*."""
+
+    entries = []
+    total = 0
+    try:
+        with os.scandir(RESULTS_DIR) as it:
+            for entry in it:
+                if ".partial" in entry.name or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                total += stat.st_size
+    except FileNotFoundError:
+        return
+    if total <= max_bytes:
+        return
+    entries.sort()
+    for _, size, path in entries:
+        if keep is not None and path == str(keep):
+            continue
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        _forget(Path(path))
+        total -= size
+        if total <= max_bytes:
+            break
+
+
+def get(job_id: str) -> Optional[Job]:
+    job = _JOBS.get(job_id)
+    if job is not None:
+        if not _evicted(job):
+            return job
+        _forget(job.output_path)
+    if not job_id or not all(char in string.hexdigits for char in job_id):
+        return None
+    # Results outlive the process (and are shared between workers), so fall back to the disk.
+    running: Optional[Job] = None
+    for candidate in RESULTS_DIR.glob(f"{job_id}.*"):
+        if ".partial" not in candidate.name:
+            return Job(job_id=job_id, output_path=candidate, filename=candidate.name, status="done")
+        output_path = candidate.with_name(candidate.name.replace(".partial", "", 1))
+        running = Job(job_id=job_id, output_path=output_path, filename=output_path.name, status="running")
+        if not _claimed(candidate) and not output_path.exists():
+            # Left behind by a worker that died (or one that just failed);
+            # requesting the render again takes the partial file over.
+            running.status = "error"
+            running.error = "Render was interrupted; please request it again."
+    return running
+
+
+__all__ = [
+    "Job",
+    "RESULTS_DIR",
+    "RESULTS_MAX_BYTES",
+    "result_key",
+    "result_path",
+    "cached_result",
+    "submit",
+    "run",
+    "evict",
+    "get",
+]
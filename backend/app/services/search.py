@@ -1,18 +1,100 @@
 from __future__ import annotations
 
-from dataclasses import asdict
-from typing import Any, Dict
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import fields
+from operator import attrgetter
+from typing import Any, Dict, List, Tuple
 
 from ..utils import finding_image
 
+_ENTRY_FIELDS = tuple(field.name for field in fields(finding_image.IndexEntry))
+_entry_values = attrgetter(*_ENTRY_FIELDS)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+# The RDR index changes rarely, but product availability can flip at any time,
+# so index matches and HEAD checks expire separately.
+SEARCH_INDEX_TTL_SECONDS = _env_int("SEARCH_INDEX_TTL_SECONDS", 3600)
+SEARCH_VERIFY_TTL_SECONDS = _env_int("SEARCH_VERIFY_TTL_SECONDS", 300)
+_MAX_CACHED_SEARCHES = 1024
+_MAX_CACHED_URLS = 1 << 14
+
+_SEARCHES: "OrderedDict[Tuple[str, int], Tuple[float, List[finding_image.IndexEntry]]]" = OrderedDict()
+_VERIFIED: "OrderedDict[str, Tuple[float, bool]]" = OrderedDict()
+_LOCK = threading.Lock()
+
 
 def search(scene: str, limit: int = 20) -> Dict[str, Any]:
+    """Search the HiRISE index, reusing recent index matches and availability checks."""
+
+    entries = _index_matches(scene, limit)
+    available = _availability([entry.url for entry in entries])
+    items = []
+    for entry in entries:
+        item = dict(zip(_ENTRY_FIELDS, _entry_values(entry)))
+        item["verified"] = available[entry.url]
+        items.append(item)
+    return {"query": scene, "count": len(items), "items": items}
+
+
+def _index_matches(scene: str, limit: int) -> List[finding_image.IndexEntry]:
+    """Index entries for *scene*, scanning the index again once the cached scan expires."""
+
+    key = (scene.strip(), limit)
+    now = time.monotonic()
+    with _LOCK:
+        cached = _SEARCHES.get(key)
+        if cached is not None and now - cached[0] < SEARCH_INDEX_TTL_SECONDS:
+            _SEARCHES.move_to_end(key)
+            return cached[1]
+    # The scan verifies each match while the index streams; keep those checks.
     entries = finding_image.search_index(scene, limit=limit)
-    return {
-        "query": scene,
-        "count": len(entries),
-        "items": [asdict(entry) for entry in entries],
-    }
+    with _LOCK:
+        _SEARCHES[key] = (now, entries)
+        _SEARCHES.move_to_end(key)
+        while len(_SEARCHES) > _MAX_CACHED_SEARCHES:
+            _SEARCHES.popitem(last=False)
+        for entry in entries:
+            _remember(entry.url, entry.verified, now)
+    return entries
+
+
+def _availability(urls: List[str]) -> Dict[str, bool]:
+    """Whether each of *urls* is downloadable, HEAD-checking those not checked recently."""
+
+    now = time.monotonic()
+    available: Dict[str, bool] = {}
+    with _LOCK:
+        for url in urls:
+            cached = _VERIFIED.get(url)
+            if cached is not None and now - cached[0] < SEARCH_VERIFY_TTL_SECONDS:
+                available[url] = cached[1]
+    stale = [url for url in dict.fromkeys(urls) if url not in available]
+    if stale:
+        checked = finding_image.verify_urls(stale)
+        with _LOCK:
+            for url, ok in zip(stale, checked):
+                _remember(url, ok, now)
+        available.update(zip(stale, checked))
+    return available
+
+
+def _remember(url: str, ok: bool, checked_at: float) -> None:
+    """Record a HEAD check; the caller holds `_LOCK`."""
+
+    _VERIFIED[url] = (checked_at, ok)
+    _VERIFIED.move_to_end(url)
+    while len(_VERIFIED) > _MAX_CACHED_URLS:
+        _VERIFIED.popitem(last=False)
 
 
 __all__ = ["search"]
@@ -13,23 +13,40 @@ the accompanying `.LBL` file (if available) so tiles can be geolocated later.
 
 import argparse
 import json
+import multiprocessing
+import os
 import re
+import shlex
 import shutil
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from functools import partial
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple
 
 try:
     from tqdm import tqdm
 except ImportError:  # pragma: no cover - optional dependency
     tqdm = None
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 try:
     import pvl  # type: ignore
 except ImportError:  # pragma: no cover - optional dependency
     pvl = None
 
+try:
+    import pyvips  # type: ignore
+except (ImportError, OSError):  # pragma: no cover - optional dependency (needs libvips)
+    pyvips = None
+
 CommandBuilder = Callable[[str, Path, Path, str, Optional[int]], List[str]]
 
 
@@ -89,6 +106,7 @@ CONVERTERS: Tuple[Tuple[str, CommandBuilder], ...] = (
     ("magick", magick_builder),
     ("convert", convert_builder),
 )
+CONVERTER_BUILDERS: Dict[str, CommandBuilder] = dict(CONVERTERS)
 
 
 FORMAT_ALIASES = {
@@ -114,6 +132,14 @@ PIL_FORMAT = {
 }
 
 
+# Every alias mapped straight to (canonical name, file suffix, Pillow format).
+_FMT: Dict[str, Tuple[str, str, str]] = {
+    alias: (canon, FORMAT_SUFFIX[canon], PIL_FORMAT[canon])
+    for alias, canon in FORMAT_ALIASES.items()
+}
+_VALID = ", ".join(sorted(_FMT))
+
+
 SCENE_PATTERN = re.compile(
     r"^(?P<product>[A-Z0-9]+)_(?P<orbit>\d{6})_(?P<target>\d{4})_(?P<band>[A-Z0-9]+)$"
 )
@@ -207,7 +233,15 @@ def load_label_metadata(src: Path) -> Tuple[Optional[Dict[str, Any]], Optional[s
 def write_manifest(manifest_dir: Path, manifest: Dict[str, Any]) -> Path:
     manifest_path = manifest_dir / "metadata.json"
     manifest_dir.mkdir(parents=True, exist_ok=True)
-    manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    data: Optional[bytes] = None
+    if orjson is not None:
+        try:
+            data = orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+        except TypeError:  # pragma: no cover - e.g. integers beyond 64 bits
+            data = None
+    if data is None:
+        data = json.dumps(manifest, indent=2).encode("utf-8")
+    manifest_path.write_bytes(data)
     return manifest_path
 
 
@@ -233,15 +267,31 @@ def parse_scene_name(path: Path) -> Dict[str, Any]:
 
 
 def normalize_format(fmt: str) -> str:
-    key = fmt.lower()
-    if key not in FORMAT_ALIASES:
-        valid = ", ".join(sorted(FORMAT_SUFFIX))
-        raise ValueError(f"Unsupported format '{fmt}'. Valid choices: {valid}")
-    normalized = FORMAT_ALIASES[key]
-    if normalized not in FORMAT_SUFFIX:
-        valid = ", ".join(sorted(FORMAT_SUFFIX))
-        raise ValueError(f"Unhandled format '{fmt}'. Valid choices: {valid}")
-    return normalized
+    entry = _FMT.get(fmt.lower())
+    if entry is None:
+        raise ValueError(f"Unsupported format '{fmt}'. Valid choices: {_VALID}")
+    return entry[0]
+
+
+# Executables already located on PATH. Misses are not cached, so a tool installed
+# while the API is running is picked up on the next conversion.
+_WHICH_CACHE: Dict[str, str] = {}
+
+
+def _which(name: str) -> Optional[str]:
+    path = _WHICH_CACHE.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path:
+            _WHICH_CACHE[name] = path
+    return path
+
+
+def _forget_executable(executable: str) -> None:
+    """Drop *executable* from `_WHICH_CACHE` after it failed to start (removed or moved)."""
+
+    for name in [name for name, path in _WHICH_CACHE.items() if path == executable]:
+        del _WHICH_CACHE[name]
 
 
 def find_converters(preferred: Optional[str] = None) -> List[Tuple[str, CommandBuilder, str]]:
@@ -251,25 +301,22 @@ def find_converters(preferred: Optional[str] = None) -> List[Tuple[str, CommandB
     only that converter is returned (or an error is raised if missing).
     """
 
-    def resolve(name: str) -> Optional[str]:
-        return shutil.which(name)
-
     if preferred:
-        for name, builder in CONVERTERS:
-            if name == preferred:
-                path = resolve(name)
-                if not path:
-                    raise ConverterNotFoundError(
-                        f"Requested converter '{preferred}' not found on PATH."
-                    )
-                return [(path, builder, name)]
-        raise ConverterNotFoundError(
-            f"Unknown converter '{preferred}'. Valid options: {', '.join(n for n, _ in CONVERTERS)}"
-        )
+        builder = CONVERTER_BUILDERS.get(preferred)
+        if builder is None:
+            raise ConverterNotFoundError(
+                f"Unknown converter '{preferred}'. Valid options: {', '.join(CONVERTER_BUILDERS)}"
+            )
+        path = _which(preferred)
+        if not path:
+            raise ConverterNotFoundError(
+                f"Requested converter '{preferred}' not found on PATH."
+            )
+        return [(path, builder, preferred)]
 
     available: List[Tuple[str, CommandBuilder, str]] = []
     for name, builder in CONVERTERS:
-        path = resolve(name)
+        path = _which(name)
         if path:
             available.append((path, builder, name))
 
@@ -280,11 +327,21 @@ def find_converters(preferred: Optional[str] = None) -> List[Tuple[str, CommandB
     return available
 
 
+def default_jobs() -> int:
+    """Half the CPUs: the external decoders are multi-threaded themselves."""
+
+    return max(1, (os.cpu_count() or 1) // 2)
+
+
 def iter_jp2_files(root: Path, recursive: bool) -> Iterable[Path]:
     pattern = "**/*.JP2" if recursive else "*.JP2"
     yield from root.glob(pattern)
 
 
+# Only the end of a converter's stderr is kept; ffmpeg in particular is verbose.
+STDERR_TAIL = 4096
+
+
 def try_convert_with(
     src: Path,
     dst: Path,
@@ -299,20 +356,40 @@ def try_convert_with(
 
     cmd = builder(executable, src, dst, fmt, quality)
     try:
+        # Converters write the image to dst, so stdout is never needed.
         completed = subprocess.run(
             cmd,
-            stdout=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
             stderr=subprocess.PIPE,
             text=True,
             check=True,
         )
     except subprocess.CalledProcessError as exc:
-        return "error", exc.stderr.strip() or exc.stdout.strip() or str(exc)
+        return "error", exc.stderr[-STDERR_TAIL:].strip() or str(exc)
+    except OSError as exc:
+        _forget_executable(executable)
+        return "error", str(exc)
 
-    diagnostics = completed.stderr.strip() if completed.stderr else None
+    diagnostics = completed.stderr[-STDERR_TAIL:].strip() if completed.stderr else None
     return "ok", diagnostics
 
 
+def tiles_dir_for(image_path: Path, tiles_root: Optional[Path]) -> Path:
+    if tiles_root:
+        return tiles_root / image_path.stem
+    return image_path.parent / f"{image_path.stem}_tiles"
+
+
+# PIL modes for the libvips band layouts the manifest/restitcher understand.
+VIPS_MODES = {
+    ("uchar", 1): "L",
+    ("uchar", 2): "LA",
+    ("uchar", 3): "RGB",
+    ("uchar", 4): "RGBA",
+    ("ushort", 1): "I;16",
+}
+
+
 def split_into_tiles(
     image_path: Path,
     tile_size: int,
@@ -320,43 +397,36 @@ def split_into_tiles(
     quality: Optional[int],
     tiles_root: Optional[Path],
     root: Path,
+    stream: Optional[BinaryIO] = None,
 ) -> Tuple[int, List[Dict[str, Any]], Tuple[int, int], str, Path]:
-    try:
-        from PIL import Image
-    except ImportError as exc:  # pragma: no cover - optional dependency
-        raise RuntimeError(
-            "Tile splitting requires Pillow. Install it with 'pip install Pillow'."
-        ) from exc
+    """Cut *image_path* into a grid of tiles next to it (or under *tiles_root*).
+
+    Uses libvips' `dzsave` when `pyvips` is installed, streaming the source
+    instead of decoding the whole raster; otherwise falls back to Pillow.
+    When *stream* is given the encoded image is read from it (e.g. a
+    converter's stdout) and *image_path* only names the tiles.
+    """
 
     if tile_size <= 0:
         raise ValueError("Tile size must be a positive integer.")
 
-    base_dir = tiles_root if tiles_root else image_path.parent / f"{image_path.stem}_tiles"
-    if tiles_root:
-        base_dir = tiles_root / image_path.stem
+    base_dir = tiles_dir_for(image_path, tiles_root)
     base_dir.mkdir(parents=True, exist_ok=True)
 
-    suffix = FORMAT_SUFFIX[output_format]
-    pil_format = PIL_FORMAT[output_format]
-    save_kwargs = {}
-    if output_format == "jpeg" and quality is not None:
-        save_kwargs["quality"] = quality
+    suffix = _FMT[output_format][1]
 
-    count = 0
-    tile_records: List[Dict[str, Any]] = []
-    Image.MAX_IMAGE_PIXELS = None
-    with Image.open(image_path) as img:
-        width, height = img.size
+    def tile_grid(
+        width: int, height: int, save: Callable[[Tuple[int, int, int, int], Path], None]
+    ) -> List[Dict[str, Any]]:
+        tile_records: List[Dict[str, Any]] = []
         for top in range(0, height, tile_size):
             for left in range(0, width, tile_size):
                 right = min(left + tile_size, width)
                 bottom = min(top + tile_size, height)
-                tile = img.crop((left, top, right, bottom))
                 row = top // tile_size
                 col = left // tile_size
                 tile_path = base_dir / f"{image_path.stem}_r{row:03d}_c{col:03d}{suffix}"
-                tile.save(tile_path, format=pil_format, **save_kwargs)
-                count += 1
+                save((left, top, right, bottom), tile_path)
                 record: Dict[str, Any] = {
                     "row": row,
                     "col": col,
@@ -371,8 +441,456 @@ def split_into_tiles(
                 except ValueError:
                     record["absolute"] = str(tile_path)
                 tile_records.append(record)
+        return tile_records
+
+    if pyvips is not None:
+        # Sequential access streams the source instead of decoding the whole raster up front.
+        if stream is not None:
+            source = pyvips.Source.new_from_descriptor(stream.fileno())
+            image = pyvips.Image.new_from_source(source, "", access="sequential")
+        else:
+            image = pyvips.Image.new_from_file(str(image_path), access="sequential")
+        mode = VIPS_MODES.get((image.format, image.bands))
+        if mode is None and stream is not None:
+            # The stream cannot be rewound for Pillow.
+            raise RuntimeError(f"Unsupported pixel layout {image.bands}x{image.format}.")
+        if mode is not None:
+            save_suffix = suffix
+            if output_format == "jpeg" and quality is not None:
+                save_suffix = f"{suffix}[Q={quality}]"
+
+            width, height = image.width, image.height
+            # dzsave cuts and encodes every tile in one threaded pass; a single
+            # pyramid level is exactly our grid, written as <level>/<col>_<row>.
+            with tempfile.TemporaryDirectory(dir=base_dir) as scratch:
+                image.dzsave(
+                    os.path.join(scratch, "dz"),
+                    tile_size=tile_size,
+                    overlap=0,
+                    depth="one",
+                    suffix=save_suffix,
+                )
+                with os.scandir(os.path.join(scratch, "dz_files")) as levels:
+                    level_dir = next(entry.path for entry in levels if entry.is_dir())
+
+                def save_vips(box: Tuple[int, int, int, int], tile_path: Path) -> None:
+                    left, top, _, _ = box
+                    name = f"{left // tile_size}_{top // tile_size}{suffix}"
+                    os.replace(os.path.join(level_dir, name), tile_path)
+
+                tile_records = tile_grid(width, height, save_vips)
+            return len(tile_records), tile_records, (width, height), mode, base_dir
+
+    try:
+        from PIL import Image
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError(
+            "Tile splitting requires Pillow (or pyvips). Install it with 'pip install Pillow'."
+        ) from exc
+
+    pil_format = _FMT[output_format][2]
+    save_kwargs = {}
+    if output_format == "jpeg" and quality is not None:
+        save_kwargs["quality"] = quality
+
+    Image.MAX_IMAGE_PIXELS = None
+    with Image.open(stream if stream is not None else image_path) as img:
+        width, height = img.size
+
+        def save_pil(box: Tuple[int, int, int, int], tile_path: Path) -> None:
+            img.crop(box).save(tile_path, format=pil_format, **save_kwargs)
+
+        tile_records = tile_grid(width, height, save_pil)
         mode = img.mode
-    return count, tile_records, (width, height), mode, base_dir
+    return len(tile_records), tile_records, (width, height), mode, base_dir
+
+
+RETILE_NAMES = ("gdal_retile.py", "gdal_retile")
+
+GDAL_FORMAT = {
+    "png": "PNG",
+    "jpeg": "JPEG",
+    "tiff": "GTiff",
+}
+
+
+def find_retile() -> Optional[Tuple[str, str]]:
+    """Return `(gdal_translate, gdal_retile)` paths, or None unless both are on PATH."""
+
+    translate = _which("gdal_translate")
+    retile = next(filter(None, (_which(name) for name in RETILE_NAMES)), None)
+    if not translate or not retile:
+        return None
+    return translate, retile
+
+
+def retile_into_tiles(
+    src: Path,
+    tile_size: int,
+    output_format: str,
+    quality: Optional[int],
+    tiles_root: Optional[Path],
+    root: Path,
+    gdal: Tuple[str, str],
+) -> Tuple[int, List[Dict[str, Any]], Tuple[int, int], str, Path]:
+    """Cut the JP2 straight into tiles with `gdal_retile`, skipping the full-size image.
+
+    Returns the same tuple as `split_into_tiles`.
+    """
+
+    try:
+        from PIL import Image
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError(
+            "Reading tile sizes requires Pillow. Install it with 'pip install Pillow'."
+        ) from exc
+
+    translate, retile = gdal
+    base_dir = tiles_dir_for(src, tiles_root)
+    base_dir.mkdir(parents=True, exist_ok=True)
+    suffix = _FMT[output_format][1]
+    tile_pattern = re.compile(rf"^{re.escape(src.stem)}_(\d+)_(\d+){re.escape(suffix)}$")
+
+    def gdal_run(cmd: List[str]) -> None:
+        try:
+            subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True)
+        except subprocess.CalledProcessError as exc:
+            raise RuntimeError(exc.stderr.strip() or exc.stdout.strip() or str(exc)) from exc
+
+    with tempfile.TemporaryDirectory(dir=base_dir) as scratch:
+        source = str(src)
+        if output_format == "jpeg":
+            # Same 8-bit rescale as `gdal_builder`, applied through a virtual dataset.
+            source = str(Path(scratch) / f"{src.stem}.vrt")
+            gdal_run([translate, "-of", "VRT", "-ot", "Byte", "-scale", str(src), source])
+        cmd = [retile, "-ps", str(tile_size), str(tile_size), "-of", GDAL_FORMAT[output_format]]
+        if output_format == "jpeg":
+            cmd.extend(["-co", f"QUALITY={quality if quality is not None else 90}"])
+        cmd.extend(["-targetDir", scratch + os.sep, source])
+        gdal_run(cmd)
+
+        produced = []
+        for tile_file in Path(scratch).iterdir():
+            match = tile_pattern.match(tile_file.name)
+            if match:
+                produced.append((int(match.group(1)), int(match.group(2)), tile_file))
+        if not produced:
+            raise RuntimeError(f"gdal_retile produced no tiles for {src.name}.")
+
+        # gdal_retile numbers rows/columns from 1 with variable zero padding.
+        first_row = min(row for row, _, _ in produced)
+        first_col = min(col for _, col, _ in produced)
+        tile_records: List[Dict[str, Any]] = []
+        mode = "L"
+        width = height = 0
+        for row, col, tile_file in sorted(produced):
+            row -= first_row
+            col -= first_col
+            with Image.open(tile_file) as tile:
+                tile_width, tile_height = tile.size
+                mode = tile.mode
+            tile_path = base_dir / f"{src.stem}_r{row:03d}_c{col:03d}{suffix}"
+            os.replace(tile_file, tile_path)
+            x, y = col * tile_size, row * tile_size
+            width, height = max(width, x + tile_width), max(height, y + tile_height)
+            record: Dict[str, Any] = {
+                "row": row,
+                "col": col,
+                "x": x,
+                "y": y,
+                "width": tile_width,
+                "height": tile_height,
+                "path": tile_path.name,
+            }
+            try:
+                record["relative_to_root"] = str(tile_path.relative_to(root))
+            except ValueError:
+                record["absolute"] = str(tile_path)
+            tile_records.append(record)
+    return len(tile_records), tile_records, (width, height), mode, base_dir
+
+
+# How each converter writes the requested format to stdout for --stream-tiles.
+FFMPEG_PIPE_CODECS = {"png": "png", "jpeg": "mjpeg", "tiff": "tiff"}
+MAGICK_PIPE_CODERS = {"png": "png", "jpeg": "jpeg", "tiff": "tiff"}
+
+
+def stream_command(
+    name: str, executable: str, src: Path, fmt: str, quality: Optional[int]
+) -> Optional[List[str]]:
+    """Converter command that writes the image to stdout, or None if *name* cannot."""
+
+    # Every builder puts the destination last; swap it for the tool's stdout target.
+    cmd = CONVERTER_BUILDERS[name](executable, src, Path(os.devnull), fmt, quality)[:-1]
+    if name == "ffmpeg":
+        return cmd + ["-f", "image2pipe", "-c:v", FFMPEG_PIPE_CODECS[fmt], "pipe:1"]
+    if name == "gdal_translate":
+        # GeoTIFF output needs a seekable file.
+        return None if fmt == "tiff" else cmd + ["/vsistdout/"]
+    return cmd + [f"{MAGICK_PIPE_CODERS[fmt]}:-"]
+
+
+def stream_into_tiles(
+    jp2: Path,
+    converters: List[Tuple[str, CommandBuilder, str]],
+    output_format: str,
+    quality: Optional[int],
+    tile_size: int,
+    tiles_root: Optional[Path],
+    root: Path,
+) -> Tuple[str, Tuple[int, List[Dict[str, Any]], Tuple[int, int], str, Path]]:
+    """Tile the converter's stdout directly, trying each converter in turn.
+
+    Returns the converter name and the `split_into_tiles` result; raises
+    `RuntimeError` when every converter fails.
+    """
+
+    naming_path = jp2.with_name(jp2.stem + _FMT[output_format][1])
+    errors: List[str] = []
+    for executable, _, name in converters:
+        cmd = stream_command(name, executable, jp2, output_format, quality)
+        if cmd is None:
+            continue
+        # stderr goes to a file so a chatty converter cannot stall on a full pipe.
+        with tempfile.TemporaryFile() as stderr:
+            try:
+                proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+            except OSError as exc:
+                _forget_executable(executable)
+                errors.append(f"{name}: {exc}")
+                continue
+            tiling = None
+            error = ""
+            try:
+                tiling = split_into_tiles(
+                    naming_path,
+                    tile_size,
+                    output_format,
+                    quality if output_format == "jpeg" else None,
+                    tiles_root,
+                    root,
+                    stream=proc.stdout,
+                )
+            except Exception as exc:
+                proc.kill()
+                error = str(exc)
+            finally:
+                proc.stdout.close()
+                returncode = proc.wait()
+            if tiling is not None and returncode == 0:
+                return name, tiling
+            stderr.seek(max(0, os.fstat(stderr.fileno()).st_size - STDERR_TAIL))
+            detail = stderr.read().decode("utf-8", errors="replace").strip()
+            errors.append(f"{name}: {detail or error or f'exit code {returncode}'}")
+    raise RuntimeError("; ".join(errors) or "No converter can stream this format.")
+
+
+def _convert_one(
+    jp2: Path,
+    rel: Path,
+    dst_path: Path,
+    converters: List[Tuple[str, CommandBuilder, str]],
+    force: bool,
+    output_format: str,
+    quality: Optional[int],
+) -> Tuple[str, List[str]]:
+    last_error: Optional[str] = None
+    status: Optional[str] = None
+    detail: Optional[str] = None
+    used_converter: Optional[str] = None
+    for executable, builder, name in converters:
+        status, detail = try_convert_with(
+            jp2,
+            dst_path,
+            force,
+            executable,
+            builder,
+            output_format,
+            quality,
+        )
+        if status in {"ok", "skip"}:
+            used_converter = name
+            break
+        # status == 'error'
+        last_error = f"{name}: {detail}"
+    else:
+        message = last_error or "All converters failed."
+        return "failed", [f"❌ Failed {rel}: {message}"]
+
+    if status == "ok":
+        outcome = "converted"
+        message = f"✅ {rel} → {dst_path.name} [{used_converter}]"
+        if detail:
+            message = f"{message}\n{detail}"
+    else:
+        outcome = "skipped"
+        message = f"⏭️  Skipped {rel}: {detail}"
+    return outcome, [message]
+
+
+def _process_one(
+    jp2: Path,
+    *,
+    root: Path,
+    converters: List[Tuple[str, CommandBuilder, str]],
+    force: bool,
+    output_format: str,
+    quality: Optional[int],
+    tile_size: Optional[int],
+    tiles_root: Optional[Path],
+    gdal: Optional[Tuple[str, str]] = None,
+    stream_tiles: bool = False,
+) -> Tuple[str, List[str]]:
+    """Convert and tile a single JP2 (run in a worker process when `jobs > 1`).
+
+    With *gdal* (see `find_retile`) and a tile size, the JP2 is tiled directly
+    without writing the full-size image; with *stream_tiles* the converter's
+    stdout is tiled instead. Returns
+    `("converted" | "skipped" | "failed", log messages)`.
+    """
+
+    rel = jp2.relative_to(root)
+    messages: List[str] = []
+    dst_path: Optional[Path] = None
+    tiling: Optional[Tuple[int, List[Dict[str, Any]], Tuple[int, int], str, Path]] = None
+    if gdal is not None and tile_size:
+        if not force and (tiles_dir_for(jp2, tiles_root) / "metadata.json").exists():
+            return "skipped", [f"⏭️  Skipped {rel}: Tiles already exist"]
+        try:
+            tiling = retile_into_tiles(
+                jp2, tile_size, output_format, quality, tiles_root, root, gdal
+            )
+        except (RuntimeError, OSError) as err:
+            return "failed", [f"❌ Failed {rel}: gdal_retile: {err}"]
+        outcome = "converted"
+        messages.append(f"✅ {rel} → tiles [gdal_retile]")
+    elif stream_tiles and tile_size:
+        if not force and (tiles_dir_for(jp2, tiles_root) / "metadata.json").exists():
+            return "skipped", [f"⏭️  Skipped {rel}: Tiles already exist"]
+        try:
+            used_converter, tiling = stream_into_tiles(
+                jp2, converters, output_format, quality, tile_size, tiles_root, root
+            )
+        except (RuntimeError, OSError) as err:
+            return "failed", [f"❌ Failed {rel}: {err}"]
+        outcome = "converted"
+        messages.append(f"✅ {rel} → tiles [{used_converter}, streamed]")
+    else:
+        dst_path = jp2.with_name(jp2.stem + _FMT[output_format][1])
+        outcome, detail_messages = _convert_one(jp2, rel, dst_path, converters, force, output_format, quality)
+        messages.extend(detail_messages)
+        if outcome == "failed":
+            return outcome, messages
+
+    label_metadata: Optional[Dict[str, Any]] = None
+    label_warning: Optional[str] = None
+    if tile_size:
+        label_metadata, label_warning = load_label_metadata(jp2)
+        if label_warning:
+            warn_message = f"⚠️  {label_warning}"
+            messages.append(warn_message)
+
+    if tile_size and dst_path is not None and dst_path.exists():
+        try:
+            tiling = split_into_tiles(
+                dst_path,
+                tile_size,
+                output_format,
+                quality if output_format == "jpeg" else None,
+                tiles_root,
+                root,
+            )
+        except Exception as tile_err:  # pragma: no cover - defensive
+            message = f"⚠️  Tiling failed for {dst_path.name}: {tile_err}"
+            messages.append(message)
+
+    if tiling is not None:
+        tiles_created, tile_records, (img_width, img_height), image_mode, base_tiles_dir = tiling
+        try:
+            location = base_tiles_dir.relative_to(root)
+        except ValueError:
+            location = base_tiles_dir
+        scene_info = parse_scene_name(jp2)
+        manifest = {
+            "source": jp2.name,
+            "source_path": relative_or_absolute(jp2, root),
+            # Direct and streamed tiling never write the full-size image, so there is no preview.
+            "output_path": relative_or_absolute(dst_path, root) if dst_path else None,
+            "output_format": output_format,
+            "image_size": {"width": img_width, "height": img_height},
+            "tile_size": tile_size,
+            "image_mode": image_mode,
+            "tiles": tile_records,
+            "tiles_root": relative_or_absolute(base_tiles_dir, root),
+            "project_root": str(root),
+        }
+        manifest.update(scene_info)
+        if label_metadata:
+            manifest["label_metadata"] = label_metadata
+        manifest_path = write_manifest(base_tiles_dir, manifest)
+        message = (
+            f"🧩  Created {tiles_created} tile(s) in {location}"
+            f" (manifest: {manifest_path.name})"
+        )
+        messages.append(message)
+
+    return outcome, messages
+
+
+def parallel_convert(
+    root: Path,
+    *,
+    recursive: bool,
+    force: bool,
+    converter: Optional[str],
+    output_format: str,
+    quality: Optional[int],
+    jobs: int,
+) -> Optional[int]:
+    """Convert every JP2 under *root* with one GNU `parallel` batch.
+
+    Only the first available converter is used and nothing is tiled; files it
+    leaves unconverted are picked up by the regular `run()` afterwards.
+    Returns parallel's exit code, or None when the batch cannot be used.
+    """
+
+    executable = _which("parallel")
+    if executable is None:
+        return None
+    try:
+        fmt = normalize_format(output_format)
+        tool, builder, _ = find_converters(converter)[0]
+    except (ValueError, ConverterNotFoundError):
+        return None
+    if fmt != "jpeg":
+        quality = None
+    elif quality is None:
+        quality = 90
+    elif not 1 <= quality <= 100:
+        return None
+
+    suffix = _FMT[fmt][1]
+    files = [
+        jp2
+        for jp2 in sorted(iter_jp2_files(root.expanduser().resolve(), recursive))
+        if force or not jp2.with_name(jp2.stem + suffix).exists()
+    ]
+    if not files:
+        return 0
+
+    # parallel substitutes (and shell-quotes) {} with the input and {.} with it minus its suffix.
+    src, dst = "<src>", "<dst>"
+    template = [
+        "{}" if word == src else "{.}" + suffix if word == dst else shlex.quote(word)
+        for word in builder(tool, Path(src), Path(dst), fmt, quality)
+    ]
+    # Outer parallelism already covers the cores, so keep each GDAL process single-threaded.
+    env = {**os.environ, "GDAL_NUM_THREADS": os.environ.get("GDAL_NUM_THREADS", "1")}
+    with tempfile.NamedTemporaryFile("w", suffix=".txt") as listing:
+        listing.writelines(f"{jp2}\n" for jp2 in files)
+        listing.flush()
+        cmd = [executable, "-j", str(jobs), "--bar", *template, "::::", listing.name]
+        return subprocess.run(cmd, stdout=subprocess.DEVNULL, env=env).returncode
 
 
 def parse_args() -> argparse.Namespace:
@@ -417,188 +935,222 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--tile-size",
         type=int,
-        help="Split output into square tiles of this size (pixels). Requires Pillow.",
+        help="Split output into square tiles of this size (pixels). Requires Pillow or pyvips.",
     )
     parser.add_argument(
         "--tiles-dir",
         help="Directory to store generated tiles (defaults to <image>_tiles next to the output).",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--direct-tiles",
+        action="store_true",
+        help=(
+            "With --tile-size, cut tiles straight from the JP2 using gdal_retile instead of "
+            "converting the full image first (no preview image is written)."
+        ),
+    )
+    parser.add_argument(
+        "--stream-tiles",
+        action="store_true",
+        help=(
+            "With --tile-size, tile the converter's stdout instead of writing the full "
+            "image to disk first (no preview image is written)."
+        ),
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=default_jobs(),
+        help="Number of files to convert in parallel (default: half the CPU count).",
+    )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        metavar="N",
+        help=(
+            "Convert files with GNU parallel running N converter processes, then tile "
+            "and write manifests as usual (requires 'parallel' on PATH)."
+        ),
+    )
+    args = parser.parse_args()
+    if args.parallel and (args.direct_tiles or args.stream_tiles):
+        # Both tile without the full-size image that the parallel batch would write.
+        parser.error("--parallel cannot be combined with --direct-tiles or --stream-tiles.")
+    return args
+
+
+def run(
+    path: Path,
+    *,
+    recursive: bool = False,
+    force: bool = False,
+    converter: Optional[str] = None,
+    output_format: str = "png",
+    quality: Optional[int] = None,
+    tile_size: Optional[int] = None,
+    tiles_dir: Optional[str] = None,
+    direct_tiles: bool = False,
+    stream_tiles: bool = False,
+    jobs: Optional[int] = None,
+    log: Optional[Callable[[str], None]] = None,
+) -> Dict[str, int]:
+    """Convert (and optionally tile) every JP2 under *path*.
+
+    Files are processed by up to *jobs* worker processes (default:
+    `default_jobs()`). Messages go to *log* when given, otherwise to the
+    console. Returns the per-file counters and the CLI exit code under
+    `returncode`.
+    """
 
+    use_tqdm = bool(tqdm and log is None and sys.stderr.isatty())
+    console: Callable[[str], None] = log or (tqdm.write if use_tqdm else print)
 
-def main() -> int:
-    args = parse_args()
-    root = Path(args.path).expanduser().resolve()
+    def report(message: str, error: bool = False) -> None:
+        if error and log is None:
+            print(message, file=sys.stderr)
+        else:
+            console(message)
+
+    def result(returncode: int, converted: int = 0, skipped: int = 0, failed: int = 0) -> Dict[str, int]:
+        return {"returncode": returncode, "converted": converted, "skipped": skipped, "failed": failed}
+
+    root = Path(path).expanduser().resolve()
     if not root.exists():
-        print(f"❌ Path not found: {root}", file=sys.stderr)
-        return 1
+        report(f"❌ Path not found: {root}", error=True)
+        return result(1)
 
     try:
-        output_format = normalize_format(args.format)
+        output_format = normalize_format(output_format)
     except ValueError as err:
-        print(f"❌ {err}", file=sys.stderr)
-        return 1
+        report(f"❌ {err}", error=True)
+        return result(1)
 
-    quality: Optional[int] = None
     if output_format == "jpeg":
-        if args.quality is not None and not (1 <= args.quality <= 100):
-            print("❌ JPEG quality must be between 1 and 100.", file=sys.stderr)
-            return 1
-        quality = args.quality if args.quality is not None else 90
-    elif args.quality is not None:
-        print("⚠️  --quality is only used for JPEG output. Ignoring.")
-
-    if args.tile_size is not None and args.tile_size <= 0:
-        print("❌ --tile-size must be a positive integer.", file=sys.stderr)
-        return 1
+        if quality is not None and not (1 <= quality <= 100):
+            report("❌ JPEG quality must be between 1 and 100.", error=True)
+            return result(1)
+        quality = quality if quality is not None else 90
+    elif quality is not None:
+        report("⚠️  --quality is only used for JPEG output. Ignoring.")
+        quality = None
+
+    if tile_size is not None and tile_size <= 0:
+        report("❌ --tile-size must be a positive integer.", error=True)
+        return result(1)
 
     tiles_root: Optional[Path] = None
-    if args.tiles_dir:
-        tiles_root = Path(args.tiles_dir)
+    if tiles_dir:
+        tiles_root = Path(tiles_dir)
         if not tiles_root.is_absolute():
             tiles_root = root / tiles_root
         tiles_root.mkdir(parents=True, exist_ok=True)
 
-    output_suffix = FORMAT_SUFFIX[output_format]
-
     try:
-        converters = find_converters(args.converter)
+        converters = find_converters(converter)
     except ConverterNotFoundError as err:
-        print(f"❌ {err}", file=sys.stderr)
-        return 1
+        report(f"❌ {err}", error=True)
+        return result(1)
 
-    files = sorted(iter_jp2_files(root, args.recursive))
+    files = sorted(iter_jp2_files(root, recursive))
     if not files:
-        print("⚠️  No JP2 files found.")
-        return 0
+        report("⚠️  No JP2 files found.")
+        return result(0)
+
+    gdal: Optional[Tuple[str, str]] = None
+    if direct_tiles:
+        gdal = find_retile() if tile_size else None
+        if gdal is None:
+            report(
+                "⚠️  --direct-tiles needs --tile-size plus gdal_translate and gdal_retile on PATH;"
+                " converting full images instead."
+            )
 
-    converter_names = ", ".join(Path(path).name for path, _, _ in converters)
-    print(f"🔧 Using converter order: {converter_names}")
-    converted = skipped = failed = 0
+    if stream_tiles and not tile_size:
+        report("⚠️  --stream-tiles needs --tile-size; converting full images instead.")
+        stream_tiles = False
 
-    progress_iter: Iterable[Path]
-    total_files = len(files)
-    if tqdm and sys.stderr.isatty():
-        progress_iter = tqdm(files, desc="Converting", unit="file")
+    if gdal is not None:
+        report(f"🔧 Tiling directly with {Path(gdal[1]).name}")
     else:
-        progress_iter = files
-
-    for jp2 in progress_iter:
-        rel = jp2.relative_to(root)
-        dst_path = jp2.with_suffix(output_suffix)
-        last_error: Optional[str] = None
-        status: Optional[str] = None
-        detail: Optional[str] = None
-        used_converter: Optional[str] = None
-        for executable, builder, name in converters:
-            status, detail = try_convert_with(
-                jp2,
-                dst_path,
-                args.force,
-                executable,
-                builder,
-                output_format,
-                quality,
+        converter_names = ", ".join(Path(exe).name for exe, _, _ in converters)
+        report(f"🔧 Using converter order: {converter_names}")
+    converted = skipped = failed = 0
+
+    worker = partial(
+        _process_one,
+        root=root,
+        converters=converters,
+        force=force,
+        output_format=output_format,
+        quality=quality,
+        tile_size=tile_size,
+        tiles_root=tiles_root,
+        gdal=gdal,
+        stream_tiles=stream_tiles,
+    )
+    workers = max(1, min(jobs if jobs is not None else default_jobs(), len(files)))
+    with ExitStack() as stack:
+        if workers > 1:
+            # "spawn" keeps workers independent of the caller's threads (e.g. the API server).
+            pool = stack.enter_context(
+                ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
             )
-            if status in {"ok", "skip"}:
-                used_converter = name
-                break
-            # status == 'error'
-            last_error = f"{name}: {detail}"
+            outcomes: Iterable[Tuple[str, List[str]]] = pool.map(worker, files)
         else:
-            failed += 1
-            message = last_error or "All converters failed."
-            if tqdm and sys.stderr.isatty():
-                tqdm.write(f"❌ Failed {rel}: {message}")
+            outcomes = map(worker, files)
+        if use_tqdm:
+            outcomes = tqdm(outcomes, total=len(files), desc="Converting", unit="file")
+        for outcome, messages in outcomes:
+            if outcome == "converted":
+                converted += 1
+            elif outcome == "skipped":
+                skipped += 1
             else:
-                print(f"❌ Failed {rel}: {message}")
-            continue
+                failed += 1
+            for message in messages:
+                report(message)
 
-        if status == "ok":
-            converted += 1
-            message = f"✅ {rel} → {dst_path.name} [{used_converter}]"
-            if detail:
-                message = f"{message}\n{detail}"
-            if tqdm and sys.stderr.isatty():
-                tqdm.write(message)
-            else:
-                print(message)
-        elif status == "skip":
-            skipped += 1
-            message = f"⏭️  Skipped {rel}: {detail}"
-            if tqdm and sys.stderr.isatty():
-                tqdm.write(message)
-            else:
-                print(message)
-
-        label_metadata: Optional[Dict[str, Any]] = None
-        label_warning: Optional[str] = None
-        if args.tile_size:
-            label_metadata, label_warning = load_label_metadata(jp2)
-            if label_warning:
-                warn_message = f"⚠️  {label_warning}"
-                if tqdm and sys.stderr.isatty():
-                    tqdm.write(warn_message)
-                else:
-                    print(warn_message)
-
-        if args.tile_size and dst_path.exists():
-            try:
-                (
-                    tiles_created,
-                    tile_records,
-                    (img_width, img_height),
-                    image_mode,
-                    base_tiles_dir,
-                ) = split_into_tiles(
-                    dst_path,
-                    args.tile_size,
-                    output_format,
-                    quality if output_format == "jpeg" else None,
-                    tiles_root,
-                    root,
-                )
-            except Exception as tile_err:  # pragma: no cover - defensive
-                message = f"⚠️  Tiling failed for {dst_path.name}: {tile_err}"
-                if tqdm and sys.stderr.isatty():
-                    tqdm.write(message)
-                else:
-                    print(message)
-            else:
-                try:
-                    location = base_tiles_dir.relative_to(root)
-                except ValueError:
-                    location = base_tiles_dir
-                scene_info = parse_scene_name(jp2)
-                manifest = {
-                    "source": jp2.name,
-                    "source_path": relative_or_absolute(jp2, root),
-                    "output_path": relative_or_absolute(dst_path, root),
-                    "output_format": output_format,
-                    "image_size": {"width": img_width, "height": img_height},
-                    "tile_size": args.tile_size,
-                    "image_mode": image_mode,
-                    "tiles": tile_records,
-                    "tiles_root": relative_or_absolute(base_tiles_dir, root),
-                    "project_root": str(root),
-                }
-                manifest.update(scene_info)
-                if label_metadata:
-                    manifest["label_metadata"] = label_metadata
-                manifest_path = write_manifest(base_tiles_dir, manifest)
-                message = (
-                    f"🧩  Created {tiles_created} tile(s) in {location}"
-                    f" (manifest: {manifest_path.name})"
-                )
-                if tqdm and sys.stderr.isatty():
-                    tqdm.write(message)
-                else:
-                    print(message)
-
-    print(
+    report(
         f"\nDone. Converted: {converted}, Skipped: {skipped}, Failed: {failed}."
     )
-    return 0 if failed == 0 else 2
+    return result(0 if failed == 0 else 2, converted, skipped, failed)
+
+
+def main() -> int:
+    args = parse_args()
+    if args.parallel:
+        batch = parallel_convert(
+            Path(args.path),
+            recursive=args.recursive,
+            force=args.force,
+            converter=args.converter,
+            output_format=args.format,
+            quality=args.quality,
+            jobs=args.parallel,
+        )
+        if batch is None:
+            print("⚠️  --parallel needs GNU parallel and a converter on PATH; converting in Python instead.")
+        elif batch != 0:
+            # Which outputs are stale is unknown, so --force still applies to the retry.
+            print("⚠️  GNU parallel reported failures; retrying unconverted files in Python.")
+        else:
+            # Every output is fresh, so run() only tiles and writes manifests.
+            args.force = False
+    outcome = run(
+        Path(args.path),
+        recursive=args.recursive,
+        force=args.force,
+        converter=args.converter,
+        output_format=args.format,
+        quality=args.quality,
+        tile_size=args.tile_size,
+        tiles_dir=args.tiles_dir,
+        direct_tiles=args.direct_tiles,
+        stream_tiles=args.stream_tiles,
+        jobs=args.jobs,
+    )
+    return outcome["returncode"]
 
 
 if __name__ == "__main__":
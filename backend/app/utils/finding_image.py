@@ -9,23 +9,33 @@ workflow for manual use).
 from __future__ import annotations
 
 import argparse
-import csv
 import os
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
 
 INDEX_URL = "https://hirise-pds.lpl.arizona.edu/PDS/INDEX/RDRINDEX.TAB"
 PDS_BASE = "https://hirise-pds.lpl.arizona.edu/PDS/"
 DOWNLOAD_EXTENSIONS = [".JP2", ".LBL"]
 TIMEOUT = 60
+# Concurrent HEAD checks (and pooled keep-alive connections) per search.
+HEAD_WORKERS = 16
+# Files downloaded at once, and Range requests per file when the server supports them.
+DOWNLOAD_WORKERS = 4
+DOWNLOAD_SEGMENTS = 4
+CHUNK_SIZE = 1 << 20
 
 SCENE_REGEX = re.compile(r"_(?P<orbit>\d{6})_(?P<target>\d{4})_")
+ORBIT_REGEX = re.compile(r"_(?P<orbit>\d{6})_")
+TARGET_REGEX = re.compile(r"\d{4}")
 
 
 @dataclass
@@ -39,7 +49,7 @@ class IndexEntry:
 
 def extract_target_code(scene_or_code: str) -> Optional[str]:
     scene_or_code = scene_or_code.strip()
-    if re.fullmatch(r"\d{4}", scene_or_code):
+    if TARGET_REGEX.fullmatch(scene_or_code):
         return scene_or_code
     match = SCENE_REGEX.search(scene_or_code)
     if match:
@@ -48,25 +58,62 @@ def extract_target_code(scene_or_code: str) -> Optional[str]:
 
 
 def compute_orbit_folder(scene_id: str) -> Optional[str]:
-    match = re.search(r"_(\d{6})_", scene_id)
+    match = ORBIT_REGEX.search(scene_id)
     if not match:
         return None
-    orbit = int(match.group(1))
+    return _orbit_folder_from_match(match)
+
+
+def _orbit_folder_from_match(match: re.Match) -> str:
+    """Orbit folder for a `SCENE_REGEX`-style match, without searching again."""
+
+    return orbit_folder(int(match.group("orbit")))
+
+
+def orbit_folder(orbit: int) -> str:
     low = orbit - (orbit % 100)
     high = low + 99
     return f"ORB_{low:06d}_{high:06d}"
 
 
-def iter_index_rows() -> Iterable[List[str]]:
-    with requests.get(INDEX_URL, stream=True, timeout=TIMEOUT) as response:
+def http_session(pool_size: int = HEAD_WORKERS) -> requests.Session:
+    """Session whose connection pool can keep *pool_size* connections alive."""
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def url_exists(session: requests.Session, url: str) -> bool:
+    try:
+        return session.head(url, allow_redirects=True, timeout=TIMEOUT).ok
+    except requests.RequestException:
+        return False
+
+
+def iter_index_filenames(target_code: str, session: Optional[requests.Session] = None) -> Iterable[str]:
+    """Stream the index, yielding the JP2 file paths whose name contains *target_code*.
+
+    Rows are split by hand rather than through `csv`: the file path is always
+    the second (quoted) column, and rows for other targets are rejected before
+    anything is decoded.
+    """
+
+    needle = target_code.encode("ascii")
+    with (session or requests).get(INDEX_URL, stream=True, timeout=TIMEOUT) as response:
         response.raise_for_status()
-        for raw_line in response.iter_lines(decode_unicode=True):
-            if not raw_line:
+        for raw_line in response.iter_lines(chunk_size=1 << 20):
+            if needle not in raw_line:
                 continue
-            try:
-                yield next(csv.reader([raw_line]))
-            except csv.Error:
+            parts = raw_line.split(b",", 2)
+            if len(parts) < 2:
+                continue
+            filename = parts[1].strip().strip(b'"').strip()
+            if needle not in filename or b"JP2" not in filename.rsplit(b"/", 1)[-1].upper():
                 continue
+            yield filename.decode("ascii", errors="replace")
 
 
 def search_index(scene_or_code: str, limit: Optional[int] = None) -> List[IndexEntry]:
@@ -74,65 +121,143 @@ def search_index(scene_or_code: str, limit: Optional[int] = None) -> List[IndexE
     if not target_code:
         raise ValueError("Unable to determine target code from input.")
 
+    # One search per row yields both the target check and the orbit number.
+    scene_pattern = re.compile(rf"_(?P<orbit>\d{{6}})_{re.escape(target_code)}_")
     entries: List[IndexEntry] = []
-    for row in iter_index_rows():
-        if len(row) < 2:
-            continue
-        filename = row[1].strip()
-        if not filename or target_code not in filename:
-            continue
-        basename = os.path.basename(filename)
-        if "JP2" not in basename.upper():
-            continue
-        match = SCENE_REGEX.search(basename)
-        if not match or match.group("target") != target_code:
-            continue
-
-        url = urljoin(PDS_BASE, filename.lstrip("/"))
-        orbit_folder = compute_orbit_folder(basename)
-        verified = False
-        try:
-            head_response = requests.head(url, allow_redirects=True, timeout=TIMEOUT)
-            verified = head_response.ok
-        except requests.RequestException:
-            verified = False
-
-        entries.append(IndexEntry(filename=basename, url=url, target_code=target_code, orbit_folder=orbit_folder, verified=verified))
-
-        if limit and len(entries) >= limit:
-            break
+    checks: List[Future[bool]] = []
+    # Each match is verified while the rest of the index is still streaming.
+    with http_session(HEAD_WORKERS + 1) as session, ThreadPoolExecutor(max_workers=HEAD_WORKERS) as pool:
+        for filename in iter_index_filenames(target_code, session):
+            basename = os.path.basename(filename)
+            match = scene_pattern.search(basename)
+            if not match:
+                continue
+
+            url = urljoin(PDS_BASE, filename.lstrip("/"))
+            folder = _orbit_folder_from_match(match)
+            entries.append(IndexEntry(filename=basename, url=url, target_code=target_code, orbit_folder=folder, verified=False))
+            checks.append(pool.submit(url_exists, session, url))
+
+            if limit and len(entries) >= limit:
+                break
+
+        for entry, check in zip(entries, checks):
+            entry.verified = check.result()
     return entries
 
 
+def verify_urls(urls: List[str]) -> List[bool]:
+    """HEAD-check *urls* concurrently, in order."""
+
+    if not urls:
+        return []
+    workers = min(HEAD_WORKERS, len(urls))
+    with http_session(workers) as session, ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(partial(url_exists, session), urls))
+
+
+class RangeNotSupported(Exception):
+    pass
+
+
+def _fetch_range(
+    session: requests.Session, url: str, fd: int, start: int, end: int, bar: tqdm
+) -> None:
+    headers = {"Range": f"bytes={start}-{end}"}
+    with session.get(url, headers=headers, stream=True, timeout=TIMEOUT) as response:
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise RangeNotSupported(url)
+        offset = start
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            os.pwrite(fd, chunk, offset)
+            offset += len(chunk)
+            bar.update(len(chunk))
+    if offset != end + 1:
+        raise IOError(f"Short read for bytes {start}-{end} of {url}")
+
+
+def _fetch_segments(session: requests.Session, url: str, partial_path: Path, total: int, bar: tqdm) -> None:
+    fd = os.open(partial_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(fd, 0, total)
+        else:  # pragma: no cover - platform dependent
+            os.ftruncate(fd, total)
+        step = -(-total // DOWNLOAD_SEGMENTS)
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_SEGMENTS) as pool:
+            futures = [
+                pool.submit(_fetch_range, session, url, fd, start, min(start + step, total) - 1, bar)
+                for start in range(0, total, step)
+            ]
+            for future in futures:
+                future.result()
+    finally:
+        os.close(fd)
+
+
+def _fetch_stream(session: requests.Session, url: str, partial_path: Path, bar: tqdm) -> None:
+    with session.get(url, stream=True, timeout=TIMEOUT) as response:
+        response.raise_for_status()
+        with open(partial_path, "wb") as handle:
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                if chunk:
+                    handle.write(chunk)
+                    bar.update(len(chunk))
+
+
+def download_file(session: requests.Session, url: str, destination: Path) -> bool:
+    """Download *url* to *destination*, in parallel byte ranges when the server allows it."""
+
+    partial_path = destination.with_name(destination.name + ".part")
+    try:
+        head = session.head(url, allow_redirects=True, timeout=TIMEOUT)
+        head.raise_for_status()
+        total = int(head.headers.get("content-length", 0))
+        ranged = (
+            hasattr(os, "pwrite")
+            and head.headers.get("accept-ranges", "").lower() == "bytes"
+            and total >= DOWNLOAD_SEGMENTS * CHUNK_SIZE
+        )
+        with tqdm(total=total, unit="B", unit_scale=True, desc=destination.name, leave=False) as bar:
+            try:
+                if not ranged:
+                    raise RangeNotSupported(url)
+                _fetch_segments(session, url, partial_path, total, bar)
+            except RangeNotSupported:
+                bar.reset()
+                _fetch_stream(session, url, partial_path, bar)
+        os.replace(partial_path, destination)
+    except Exception:
+        partial_path.unlink(missing_ok=True)
+        return False
+    return True
+
+
 def download_entries(entries: List[IndexEntry], output_dir: Path) -> List[Path]:
     output_dir.mkdir(parents=True, exist_ok=True)
-    saved_paths: List[Path] = []
 
-    for entry in tqdm(entries, desc="Downloading scenes", unit="scene"):
+    targets: List[Tuple[str, Path]] = []
+    for entry in entries:
         base_url = entry.url.rsplit(".", 1)[0]
         for ext in DOWNLOAD_EXTENSIONS:
             file_url = base_url + ext
             destination = output_dir / Path(file_url).name
-            if destination.exists():
-                continue
-            try:
-                response = requests.get(file_url, stream=True, timeout=TIMEOUT)
-                response.raise_for_status()
-                total = int(response.headers.get("content-length", 0))
-                with open(destination, "wb") as handle, tqdm(
-                    total=total,
-                    unit="B",
-                    unit_scale=True,
-                    desc=destination.name,
-                    leave=False,
-                ) as bar:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            handle.write(chunk)
-                            bar.update(len(chunk))
-            except Exception:
-                continue
-            saved_paths.append(destination)
+            if not destination.exists():
+                targets.append((file_url, destination))
+    if not targets:
+        return []
+
+    saved_paths: List[Path] = []
+    with http_session(DOWNLOAD_WORKERS * DOWNLOAD_SEGMENTS) as session, ThreadPoolExecutor(
+        max_workers=DOWNLOAD_WORKERS
+    ) as pool:
+        results = pool.map(lambda target: download_file(session, *target), targets)
+        for (_, destination), ok in tqdm(
+            zip(targets, results), total=len(targets), desc="Downloading files", unit="file"
+        ):
+            if ok:
+                saved_paths.append(destination)
     return saved_paths
 
 
@@ -2,9 +2,12 @@
 """Utility to organize HiRISE downloads by orbit."""
 
 import argparse
+import errno
+import os
 import re
+import shutil
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, Optional, Set, Tuple
 
 NAME_PATTERN = re.compile(
     r"^(?P<phase>[A-Z]+)_(?P<orbit>\d{6})_(?P<target>\d{4})_(?P<band>[A-Z0-9]+)\.(?P<ext>JP2|LBL)$"
@@ -13,9 +16,29 @@ NAME_PATTERN = re.compile(
 
 def iter_candidate_files(root: Path) -> Iterable[Path]:
     """Yield all files beneath *root* (skipping directories)."""
-    for path in root.rglob("*"):
-        if path.is_file():
-            yield path
+    for path, _, _ in _scan_candidate_files(root):
+        yield Path(path)
+
+
+def _scan_candidate_files(root: Path) -> Iterable[Tuple[str, str, Optional[re.Match]]]:
+    """Yield `(path, name, match)` for every file beneath *root*.
+
+    Walks with `os.scandir` so each entry is classified from the directory
+    listing, and matches the HiRISE naming convention on the bare name.
+    Unreadable directories are skipped, as `Path.rglob` does.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path, entry.name, NAME_PATTERN.match(entry.name)
 
 
 def parse_filename(path: Path) -> Optional[re.Match]:
@@ -23,6 +46,16 @@ def parse_filename(path: Path) -> Optional[re.Match]:
     return NAME_PATTERN.match(path.name)
 
 
+def move_file(source: str, destination: str) -> None:
+    """Rename in place, copying across filesystems only when a rename is impossible."""
+    try:
+        os.rename(source, destination)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        shutil.move(source, destination)
+
+
 def organize_data(data_root: Path) -> None:
     """Move HiRISE files under `data_root` into orbit-based subdirectories."""
     if not data_root.exists():
@@ -30,37 +63,37 @@ def organize_data(data_root: Path) -> None:
 
     moved = 0
     skipped = 0
+    root = os.fspath(data_root)
+    created: Set[str] = set()
 
-    for file_path in iter_candidate_files(data_root):
-        if file_path.name.startswith("."):
+    # Snapshot the listing so files moved into new orbit folders are not visited twice.
+    for path, name, match in list(_scan_candidate_files(data_root)):
+        if name.startswith("."):
             skipped += 1
             continue
-        match = parse_filename(file_path)
         if not match:
             skipped += 1
-            print(f"⚠️  Skipping (unrecognised name): {file_path.relative_to(data_root)}")
+            print(f"⚠️  Skipping (unrecognised name): {os.path.relpath(path, root)}")
             continue
 
         orbit = match.group("orbit")
         target = match.group("target")
-        orbit_dir = data_root / target / orbit
-        orbit_dir.mkdir(exist_ok=True)
-
-        destination = orbit_dir / file_path.name
-        if destination.exists():
+        orbit_dir = os.path.join(root, target, orbit)
+        if orbit_dir not in created:
+            os.makedirs(orbit_dir, exist_ok=True)
+            created.add(orbit_dir)
+
+        destination = os.path.join(orbit_dir, name)
+        destination_rel = os.path.join(target, orbit, name)
+        if os.path.exists(destination):
             skipped += 1
-            print(f"⚠️  Already organised: {destination.relative_to(data_root)}")
+            print(f"⚠️  Already organised: {destination_rel}")
             continue
 
-        try:
-            current_rel = file_path.relative_to(data_root)
-        except ValueError:
-            current_rel = file_path
-
-        file_path.rename(destination)
+        move_file(path, destination)
         moved += 1
         print(
-            f"✅  Moved {current_rel} → {destination.relative_to(data_root)}"
+            f"✅  Moved {os.path.relpath(path, root)} → {destination_rel}"
         )
 
     print(f"\nDone. {moved} file(s) moved, {skipped} file(s) skipped.")
@@ -11,18 +11,93 @@ the original `.LBL` file.
 from __future__ import annotations
 
 import argparse
+import atexit
 import json
 import math
+import os
+import shutil
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
 
-from PIL import Image
+import numpy as np
+from PIL import Image, UnidentifiedImageError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import tifffile
+except ImportError:  # pragma: no cover - optional dependency
+    tifffile = None
+
+try:
+    import pyvips  # type: ignore
+except (ImportError, OSError):  # pragma: no cover - optional dependency (needs libvips)
+    pyvips = None
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+# Decoded tiles kept for overlapping crops, least recently used evicted first.
+TILE_CACHE_BYTES = _env_int("TILE_CACHE_BYTES", 512 * 1024**2)
+
+_TILE_CACHE: "OrderedDict[Tuple[str, int, str], Tuple[Image.Image, int]]" = OrderedDict()
+_TILE_CACHE_LOCK = threading.Lock()
+_tile_cache_used = 0
+
+# Tile decoding threads, shared by every compose_region call so concurrent
+# crops neither pay for pool start-up nor multiply the thread count.
+DECODE_WORKERS = max(1, _env_int("RESTITCHER_WORKERS", os.cpu_count() or 4))
+_DECODE_POOL = ThreadPoolExecutor(max_workers=DECODE_WORKERS, thread_name_prefix="restitcher-decode")
+atexit.register(_DECODE_POOL.shutdown)
+
+# Finished canvases are encoded here so the composing thread can move on.
+# Each queued canvas stays in memory until written, so callers block once
+# twice as many as there are encoder threads are waiting.
+ENCODE_WORKERS = max(1, _env_int("RESTITCHER_ENCODE_WORKERS", 2))
+_ENCODE_POOL = ThreadPoolExecutor(max_workers=ENCODE_WORKERS, thread_name_prefix="restitcher-encode")
+_ENCODE_SLOTS = threading.BoundedSemaphore(2 * ENCODE_WORKERS)
+atexit.register(_ENCODE_POOL.shutdown)
+
+# Regions at least this large are written through libvips (when installed)
+# instead of being assembled on an in-memory canvas.
+STREAM_MIN_PIXELS = _env_int("STREAM_MIN_PIXELS", 64 * 1024**2)
+# Canvas modes whose tiles libvips reads with the same band layout.
+VIPS_MODES = {"L", "LA", "RGB", "RGBA", "I;16"}
 
 
 def load_manifest(path: Path) -> Dict[str, Any]:
-    if not path.exists():
-        raise FileNotFoundError(f"Manifest not found: {path}")
-    data = json.loads(path.read_text(encoding="utf-8"))
+    """Parse and validate the manifest at *path*, memoized on its path and mtime.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Manifest not found: {path}") from None
+    return _load_manifest(path.resolve(), mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _load_manifest(path: Path, mtime_ns: int) -> Dict[str, Any]:
+    data = _loads(path.read_bytes())
     required_keys = {"image_size", "tile_size", "tiles"}
     missing = required_keys - data.keys()
     if missing:
@@ -34,31 +109,255 @@ def ensure_directory(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def create_canvas(manifest: Dict[str, Any], width: int, height: int) -> Image.Image:
+def create_canvas(manifest: Dict[str, Any], width: int, height: int, fill: bool = True) -> Image.Image:
+    """Blank canvas for a mosaic; with `fill=False` the pixels are left uninitialised."""
+
     mode = manifest.get("image_mode", "RGB")
-    return Image.new(mode, (width, height))
+    return Image.new(mode, (width, height), 0 if fill else None)
 
 
-def tiles_from_manifest(manifest: Dict[str, Any], manifest_path: Path) -> Iterable[Tuple[Dict[str, Any], Path]]:
-    base_dir = manifest_path.parent
-    project_root: Optional[Path] = None
-    if "project_root" in manifest:
-        try:
-            project_root = Path(manifest["project_root"]).expanduser().resolve()
-        except Exception:
-            project_root = None
+def _project_root(manifest: Dict[str, Any]) -> Optional[Path]:
+    if "project_root" not in manifest:
+        return None
+    try:
+        return Path(manifest["project_root"]).expanduser().resolve()
+    except Exception:
+        return None
+
+
+def _resolve_tile_path(tile: Dict[str, Any], base_dir: Path, project_root: Optional[Path]) -> Path:
+    candidate = base_dir / tile["path"]
+    if candidate.exists():
+        return candidate
+    if project_root and "relative_to_root" in tile:
+        candidate = project_root / tile["relative_to_root"]
+    elif "absolute" in tile:
+        candidate = Path(tile["absolute"])
+    if not candidate.exists():
+        raise FileNotFoundError(f"Tile referenced by manifest does not exist: {tile}")
+    return candidate
+
+
+TileIndex = Dict[Tuple[int, int], Dict[str, Any]]
+
+
+@dataclass
+class _TileSet:
+    """Per tile-list geometry: the grid index and every tile's box."""
+
+    tiles: List[Dict[str, Any]]
+    index: Optional[TileIndex]
+    # (x, y, right, bottom) of every tile, one row per entry of `tiles`.
+    boxes: np.ndarray
+
+
+# Tile sets keyed by (manifest path, mtime, tile size, tile names), so equal
+# tile lists share an entry whichever dict they arrive in. Lists shorter than
+# _TILE_SET_MIN_CACHED (e.g. the per-crop subsets from the dataset service) are
+# cheap to rebuild and are not cached, so they cannot evict whole scenes.
+_TILE_SET_CACHE: "OrderedDict[Tuple[Any, ...], _TileSet]" = OrderedDict()
+_TILE_SET_CACHE_SIZE = 32
+_TILE_SET_MIN_CACHED = 64
+_TILE_SET_LOCK = threading.Lock()
+
+# Resolved tile files keyed by (manifest directory, project root, tile path).
+_TILE_PATH_CACHE: "OrderedDict[Tuple[Path, Optional[Path], str], Path]" = OrderedDict()
+_TILE_PATH_CACHE_SIZE = 1 << 17
+
+
+def build_tile_index(manifest: Dict[str, Any]) -> Optional[TileIndex]:
+    """Map `(row, col)` grid cells to tiles, or None if the tiles are not on a regular grid."""
+
+    tile_size = manifest.get("tile_size")
+    if not isinstance(tile_size, int) or tile_size <= 0:
+        return None
+    index: TileIndex = {}
     for tile in manifest["tiles"]:
-        candidate = base_dir / tile["path"]
-        if candidate.exists():
-            yield tile, candidate
+        row, y_rem = divmod(tile["y"], tile_size)
+        col, x_rem = divmod(tile["x"], tile_size)
+        if x_rem or y_rem or tile["width"] > tile_size or tile["height"] > tile_size or (row, col) in index:
+            return None
+        index[row, col] = tile
+    return index
+
+
+def _build_tile_set(manifest: Dict[str, Any]) -> _TileSet:
+    tiles = manifest["tiles"]
+    boxes = np.array(
+        [(t["x"], t["y"], t["x"] + t["width"], t["y"] + t["height"]) for t in tiles], dtype=np.int64
+    ).reshape(-1, 4)
+    return _TileSet(tiles, build_tile_index(manifest), boxes)
+
+
+def _tile_set(manifest: Dict[str, Any], manifest_path: Path) -> _TileSet:
+    tiles = manifest["tiles"]
+    if len(tiles) < _TILE_SET_MIN_CACHED:
+        return _build_tile_set(manifest)
+    try:
+        mtime_ns = manifest_path.stat().st_mtime_ns
+    except OSError:
+        return _build_tile_set(manifest)
+    key = (manifest_path.resolve(), mtime_ns, manifest.get("tile_size"), tuple(t["path"] for t in tiles))
+    with _TILE_SET_LOCK:
+        tile_set = _TILE_SET_CACHE.get(key)
+        if tile_set is not None:
+            _TILE_SET_CACHE.move_to_end(key)
+            return tile_set
+    tile_set = _build_tile_set(manifest)
+    with _TILE_SET_LOCK:
+        _TILE_SET_CACHE[key] = tile_set
+        while len(_TILE_SET_CACHE) > _TILE_SET_CACHE_SIZE:
+            _TILE_SET_CACHE.popitem(last=False)
+    return tile_set
+
+
+def tile_index(manifest: Dict[str, Any], manifest_path: Path) -> Optional[TileIndex]:
+    """Memoized `build_tile_index` for the manifest stored at *manifest_path*."""
+
+    return _tile_set(manifest, manifest_path).index
+
+
+def _tile_path(tile: Dict[str, Any], base_dir: Path, project_root: Optional[Path]) -> Path:
+    """Resolve a tile's file once; later calls (from any tile list) skip the stat."""
+
+    key = (base_dir, project_root, tile["path"])
+    with _TILE_SET_LOCK:
+        path = _TILE_PATH_CACHE.get(key)
+        if path is not None:
+            _TILE_PATH_CACHE.move_to_end(key)
+            return path
+    path = _resolve_tile_path(tile, base_dir, project_root)
+    with _TILE_SET_LOCK:
+        _TILE_PATH_CACHE[key] = path
+        while len(_TILE_PATH_CACHE) > _TILE_PATH_CACHE_SIZE:
+            _TILE_PATH_CACHE.popitem(last=False)
+    return path
+
+
+def resolve_tiles(manifest: Dict[str, Any], manifest_path: Path) -> List[Tuple[Dict[str, Any], Path]]:
+    """Pair every tile with its file, stat'ing each path only once."""
+
+    base_dir = manifest_path.parent
+    project_root = _project_root(manifest)
+    return [(tile, _tile_path(tile, base_dir, project_root)) for tile in manifest["tiles"]]
+
+
+def tiles_from_manifest(manifest: Dict[str, Any], manifest_path: Path) -> Iterable[Tuple[Dict[str, Any], Path]]:
+    return iter(resolve_tiles(manifest, manifest_path))
+
+
+@lru_cache(maxsize=None)
+def _formats_for_suffix(suffix: str) -> Optional[Tuple[str, ...]]:
+    """Pillow plugin registered for *suffix*, so `Image.open` can skip probing every format."""
+
+    fmt = Image.registered_extensions().get(suffix.lower())
+    return (fmt,) if fmt else None
+
+
+def _load_tile(path: Path, mode: str) -> Image.Image:
+    """Decoded tile at *path*, reused while the file's mtime is unchanged.
+
+    The image may be shared with other callers and must not be modified.
+    """
+
+    global _tile_cache_used
+    key = (os.fspath(path), os.stat(path).st_mtime_ns, mode)
+    with _TILE_CACHE_LOCK:
+        entry = _TILE_CACHE.get(key)
+        if entry is not None:
+            _TILE_CACHE.move_to_end(key)
+            return entry[0]
+    try:
+        tile_img = Image.open(path, formats=_formats_for_suffix(path.suffix))
+    except UnidentifiedImageError:
+        # Extension does not match the content; fall back to sniffing.
+        tile_img = Image.open(path)
+    with tile_img:
+        if tile_img.format == "JPEG":
+            # Let the JPEG decoder emit the canvas mode directly.
+            tile_img.draft(mode, tile_img.size)
+        tile_img.load()
+    size = tile_img.width * tile_img.height * len(tile_img.getbands())
+    if size <= TILE_CACHE_BYTES:
+        with _TILE_CACHE_LOCK:
+            if key not in _TILE_CACHE:
+                _TILE_CACHE[key] = (tile_img, size)
+                _tile_cache_used += size
+            while _tile_cache_used > TILE_CACHE_BYTES:
+                _, (_, evicted) = _TILE_CACHE.popitem(last=False)
+                _tile_cache_used -= evicted
+    return tile_img
+
+
+TIFF_SUFFIXES = {".tif", ".tiff"}
+
+
+def _slice_uncompressed(path: Path, crop_box: Tuple[int, int, int, int], mode: str) -> Optional[Image.Image]:
+    """Read only *crop_box* of an uncompressed TIFF through a memory map.
+
+    Returns None when `tifffile` cannot map the file (e.g. it is compressed)
+    or its pixels do not map onto *mode*.
+    """
+
+    try:
+        array = tifffile.memmap(path, mode="r")
+    except (ValueError, OSError):
+        return None
+    left, top, right, bottom = crop_box
+    fragment = Image.fromarray(np.ascontiguousarray(array[top:bottom, left:right]))
+    return fragment if fragment.mode == mode else None
+
+
+def _visible_placements(inter: np.ndarray, area: int) -> Tuple[List[int], bool]:
+    """Indices of the boxes in *inter* still visible once all are pasted in order.
+
+    Later pastes overwrite earlier ones, so the boxes are walked back to front
+    over a coverage grid whose cells are bounded by the boxes' own edges, and
+    the walk stops once they cover *area* pixels. Also reports whether the
+    region is fully covered.
+    """
+
+    xs = np.unique(inter[:, [0, 2]])
+    ys = np.unique(inter[:, [1, 3]])
+    cell_area = np.outer(np.diff(ys), np.diff(xs))
+    filled = np.zeros(cell_area.shape, dtype=bool)
+    x0, x1 = np.searchsorted(xs, inter[:, 0]), np.searchsorted(xs, inter[:, 2])
+    y0, y1 = np.searchsorted(ys, inter[:, 1]), np.searchsorted(ys, inter[:, 3])
+    painted = 0
+    keep: List[int] = []
+    for i in range(len(inter) - 1, -1, -1):
+        cells = filled[y0[i]:y1[i], x0[i]:x1[i]]
+        if cells.all():
             continue
-        if project_root and "relative_to_root" in tile:
-            candidate = project_root / tile["relative_to_root"]
-        elif "absolute" in tile:
-            candidate = Path(tile["absolute"])
-        if not candidate.exists():
-            raise FileNotFoundError(f"Tile referenced by manifest does not exist: {tile}")
-        yield tile, candidate
+        painted += int(cell_area[y0[i]:y1[i], x0[i]:x1[i]][~cells].sum())
+        cells[...] = True
+        keep.append(i)
+        if painted == area:
+            break
+    keep.reverse()
+    return keep, painted == area
+
+
+def _written() -> "Future[None]":
+    """Already-resolved future for outputs written synchronously."""
+
+    done: Future[None] = Future()
+    done.set_result(None)
+    return done
+
+
+def _can_copy_tile(tile_path: Path, output_path: Path, mode: str, size: Tuple[int, int]) -> bool:
+    """Whether *tile_path* can stand in, byte for byte, for the rendered *output_path*."""
+
+    fmt = _formats_for_suffix(output_path.suffix)
+    if fmt is None or fmt != _formats_for_suffix(tile_path.suffix):
+        return False
+    try:
+        # Opening only parses the header; no pixels are decoded.
+        with Image.open(tile_path, formats=fmt) as tile_img:
+            return tile_img.mode == mode and tile_img.size == size
+    except (OSError, UnidentifiedImageError):
+        return False
 
 
 def compose_region(
@@ -66,52 +365,155 @@ def compose_region(
     manifest_path: Path,
     bounds_px: Tuple[int, int, int, int],
     output_path: Path,
-) -> None:
+) -> "Future[None]":
+    """Render *bounds_px* of the mosaic to *output_path*.
+
+    Returns a future that resolves once the file is fully written; encoding
+    may still be running on a background thread when this returns.
+    """
+
     left, top, right, bottom = bounds_px
     width = max(0, right - left)
     height = max(0, bottom - top)
     if width == 0 or height == 0:
         raise ValueError("Requested bounds yield an empty region.")
 
-    canvas = create_canvas(manifest, width, height)
-
-    for tile_meta, tile_path in tiles_from_manifest(manifest, manifest_path):
-        tile_left = tile_meta["x"]
-        tile_top = tile_meta["y"]
-        tile_right = tile_left + tile_meta["width"]
-        tile_bottom = tile_top + tile_meta["height"]
-
-        inter_left = max(left, tile_left)
-        inter_top = max(top, tile_top)
-        inter_right = min(right, tile_right)
-        inter_bottom = min(bottom, tile_bottom)
-
-        if inter_left >= inter_right or inter_top >= inter_bottom:
-            continue
-
-        crop_box = (
-            inter_left - tile_left,
-            inter_top - tile_top,
-            inter_right - tile_left,
-            inter_bottom - tile_top,
+    # Pass 1: intersect using only the manifest geometry, so tiles outside the
+    # region are never stat'd, opened, or decoded.
+    tile_set = _tile_set(manifest, manifest_path)
+    index = tile_set.index
+    boxes = tile_set.boxes
+    hits = np.flatnonzero(
+        (boxes[:, 0] < right) & (boxes[:, 2] > left) & (boxes[:, 1] < bottom) & (boxes[:, 3] > top)
+    )
+    origins = boxes[hits][:, [0, 1, 0, 1]]
+    inter = np.clip(boxes[hits], (left, top, left, top), (right, bottom, right, bottom))
+    tiles = tile_set.tiles
+    placements: List[Tuple[Dict[str, Any], Tuple[int, int, int, int], Tuple[int, int]]] = [
+        (tiles[i], tuple(crop_box), tuple(paste_box))
+        for i, crop_box, paste_box in zip(
+            hits.tolist(), (inter - origins).tolist(), (inter[:, :2] - (left, top)).tolist()
         )
-        paste_box = (inter_left - left, inter_top - top)
-
-        with Image.open(tile_path) as tile_img:
-            fragment = tile_img.crop(crop_box)
-            canvas.paste(fragment, paste_box)
+    ]
+
+    if index is not None:
+        # On a regular grid tiles cannot overlap, so if their areas add up to
+        # the region it is fully covered and zero-filling would be wasted.
+        covered = int(((inter[:, 2] - inter[:, 0]) * (inter[:, 3] - inter[:, 1])).sum()) == width * height
+    else:
+        # Overlapping tiles: skip the ones later tiles paint over entirely.
+        keep, covered = _visible_placements(inter, width * height)
+        placements = [placements[i] for i in keep]
+    base_dir = manifest_path.parent
+    project_root = _project_root(manifest)
+
+    if len(placements) == 1 and covered and placements[0][1] == (0, 0, width, height):
+        # The region is exactly one tile: copy its file when it is already
+        # encoded the way the output would be, skipping decode and encode.
+        tile_meta = placements[0][0]
+        tile_path = _tile_path(tile_meta, base_dir, project_root)
+        if _can_copy_tile(tile_path, output_path, manifest.get("image_mode", "RGB"), (width, height)):
+            ensure_directory(output_path)
+            shutil.copyfile(tile_path, output_path)
+            return _written()
+
+    if (
+        pyvips is not None
+        and index is not None
+        and covered
+        and width * height >= STREAM_MIN_PIXELS
+        and manifest.get("image_mode", "RGB") in VIPS_MODES
+    ):
+        # Every cell in rows x cols is present (the region is fully covered),
+        # so libvips can join them on the grid and stream rows to the encoder
+        # without the whole canvas ever being in memory.
+        tile_size = manifest["tile_size"]
+        rows = range(top // tile_size, (bottom - 1) // tile_size + 1)
+        cols = range(left // tile_size, (right - 1) // tile_size + 1)
+        tiles = [
+            pyvips.Image.new_from_file(
+                os.fspath(_tile_path(index[cell], base_dir, project_root)), access="sequential"
+            )
+            for cell in product(rows, cols)
+        ]
+        mosaic = pyvips.Image.arrayjoin(tiles, across=len(cols), hspacing=tile_size, vspacing=tile_size)
+        ensure_directory(output_path)
+        mosaic.crop(left - cols.start * tile_size, top - rows.start * tile_size, width, height).write_to_file(
+            os.fspath(output_path)
+        )
+        return _written()
+
+    canvas = create_canvas(manifest, width, height, fill=not covered)
+
+    # Pass 2: decode just the intersecting tiles. Pillow's decoders release the
+    # GIL, so tiles decode on worker threads while this thread pastes them.
+
+    def decode(placement: Tuple[Dict[str, Any], Tuple[int, int, int, int], Tuple[int, int]]) -> Tuple[Image.Image, Tuple[int, int]]:
+        tile_meta, crop_box, paste_box = placement
+        tile_path = _tile_path(tile_meta, base_dir, project_root)
+        if (
+            tifffile is not None
+            and tile_path.suffix.lower() in TIFF_SUFFIXES
+            and crop_box != (0, 0, tile_meta["width"], tile_meta["height"])
+        ):
+            # Edge tiles of a crop: copy just the needed window out of the file
+            # mapping instead of decoding the whole tile.
+            fragment = _slice_uncompressed(tile_path, crop_box, canvas.mode)
+            if fragment is not None:
+                return fragment, paste_box
+        tile_img = _load_tile(tile_path, canvas.mode)
+        if tile_img.size == (tile_meta["width"], tile_meta["height"]):
+            # paste() clips to the canvas, so the tile goes in whole at its
+            # offset without an intermediate crop() copy.
+            return tile_img, (paste_box[0] - crop_box[0], paste_box[1] - crop_box[1])
+        return tile_img.crop(crop_box), paste_box
+
+    workers = min(len(placements), DECODE_WORKERS)
+    if workers <= 1:
+        for placement in placements:
+            canvas.paste(*decode(placement))
+    else:
+        # Keep a bounded window in flight so a full-scene stitch does not
+        # hold every decoded tile at once.
+        pending: Deque[Future[Tuple[Image.Image, Tuple[int, int]]]] = deque()
+        try:
+            for placement in placements:
+                pending.append(_DECODE_POOL.submit(decode, placement))
+                if len(pending) >= 2 * workers:
+                    canvas.paste(*pending.popleft().result())
+            while pending:
+                canvas.paste(*pending.popleft().result())
+        finally:
+            # A failed tile must not leave the rest of this region queued
+            # ahead of other requests on the shared pool.
+            for future in pending:
+                future.cancel()
 
     ensure_directory(output_path)
-    canvas.save(output_path)
+    _ENCODE_SLOTS.acquire()
+    try:
+        encoded = _ENCODE_POOL.submit(canvas.save, output_path)
+    except BaseException:
+        _ENCODE_SLOTS.release()
+        raise
+    encoded.add_done_callback(lambda _: _ENCODE_SLOTS.release())
+    return encoded
 
 
-def stitch_full(manifest: Dict[str, Any], manifest_path: Path, output_path: Path) -> None:
+def stitch_full(manifest: Dict[str, Any], manifest_path: Path, output_path: Path) -> "Future[None]":
     width = manifest["image_size"]["width"]
     height = manifest["image_size"]["height"]
-    compose_region(manifest, manifest_path, (0, 0, width, height), output_path)
+    return compose_region(manifest, manifest_path, (0, 0, width, height), output_path)
 
 
 def coerce_float(value: Any) -> float:
+    # Exact-type checks first: manifests hold plain numbers or, from pvl,
+    # {"value": ..., "units": ...} quantities.
+    kind = type(value)
+    if kind is float or kind is int:
+        return float(value)
+    if kind is dict and "value" in value:
+        return float(value["value"])
     if isinstance(value, (int, float)):
         return float(value)
     if isinstance(value, dict) and "value" in value:
@@ -123,13 +525,22 @@ def coerce_float(value: Any) -> float:
             except ValueError:
                 continue
         raise ValueError(f"Cannot interpret numeric value from {value!r}")
-    text = str(value)
+    number = _float_from_text(str(value))
+    if number is None:
+        raise ValueError(f"Cannot interpret numeric value from {value!r}")
+    return number
+
+
+@lru_cache(maxsize=256)
+def _float_from_text(text: str) -> Optional[float]:
+    """First number in *text*; label values repeat across scenes, so parses are memoized."""
+
     for token in text.replace(",", " ").split():
         try:
             return float(token)
         except ValueError:
             continue
-    raise ValueError(f"Cannot interpret numeric value from {value!r}")
+    return None
 
 
 def extract_bounds(manifest: Dict[str, Any]) -> Dict[str, float]:
@@ -158,12 +569,38 @@ def extract_bounds(manifest: Dict[str, Any]) -> Dict[str, float]:
     }
 
 
+def wrap_longitude(lon: float, center: float) -> float:
+    """Return the equivalent of *lon* within 180 degrees of *center* (e.g. -9 -> 351 near 350E)."""
+
+    delta = lon - center
+    if -180.0 <= delta <= 180.0:
+        # Already in the same frame; return it untouched so it stays bit-exact.
+        return lon
+    # IEEE remainder lands in [-180, 180] in constant time, however many turns off.
+    return center + math.remainder(delta, 360.0)
+
+
+def latlon_to_pixels(
+    bounds: Dict[str, float], width: int, height: int, lats: Any, lons: Any
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Map latitudes/longitudes (scalars or arrays) to fractional pixel `(x, y)` arrays.
+
+    *bounds* is the `extract_bounds` extent of a scene of *width* x *height* pixels.
+    """
+
+    lat_span = bounds["max_lat"] - bounds["min_lat"]
+    lon_span = bounds["east_lon"] - bounds["west_lon"]
+    ys = (bounds["max_lat"] - np.asarray(lats, dtype=np.float64)) / lat_span * height
+    xs = (np.asarray(lons, dtype=np.float64) - bounds["west_lon"]) / lon_span * width
+    return xs, ys
+
+
 def crop_by_latlon(
     manifest: Dict[str, Any],
     manifest_path: Path,
     latlon_bounds: Tuple[float, float, float, float],
     output_path: Path,
-) -> None:
+) -> "Future[None]":
     bounds = extract_bounds(manifest)
     lat_span = bounds["max_lat"] - bounds["min_lat"]
     lon_span = bounds["east_lon"] - bounds["west_lon"]
@@ -174,6 +611,10 @@ def crop_by_latlon(
     width = manifest["image_size"]["width"]
 
     req_min_lat, req_min_lon, req_max_lat, req_max_lon = latlon_bounds
+    # Accept either longitude convention (-180..180 or 0..360) for the request.
+    center_lon = (bounds["west_lon"] + bounds["east_lon"]) / 2
+    req_min_lon = wrap_longitude(req_min_lon, center_lon)
+    req_max_lon = wrap_longitude(req_max_lon, center_lon)
     min_lat = max(bounds["min_lat"], min(bounds["max_lat"], min(req_min_lat, req_max_lat)))
     max_lat = max(bounds["min_lat"], min(bounds["max_lat"], max(req_min_lat, req_max_lat)))
     min_lon = max(bounds["west_lon"], min(bounds["east_lon"], min(req_min_lon, req_max_lon)))
@@ -182,21 +623,10 @@ def crop_by_latlon(
     if max_lat - min_lat <= 0 or max_lon - min_lon <= 0:
         raise ValueError("Requested crop is outside the scene bounds.")
 
-    def lat_to_y(lat: float) -> float:
-        return (bounds["max_lat"] - lat) / lat_span * height
-
-    def lon_to_x(lon: float) -> float:
-        return (lon - bounds["west_lon"]) / lon_span * width
-
-    top = lat_to_y(max_lat)
-    bottom = lat_to_y(min_lat)
-    left = lon_to_x(min_lon)
-    right = lon_to_x(max_lon)
-
-    left = max(0.0, min(width, left))
-    right = max(0.0, min(width, right))
-    top = max(0.0, min(height, top))
-    bottom = max(0.0, min(height, bottom))
+    # Both corners in one pass: (north-west, south-east).
+    xs, ys = latlon_to_pixels(bounds, width, height, (max_lat, min_lat), (min_lon, max_lon))
+    left, right = np.clip(xs, 0.0, width)
+    top, bottom = np.clip(ys, 0.0, height)
 
     left_i = math.floor(left)
     top_i = math.floor(top)
@@ -206,7 +636,7 @@ def crop_by_latlon(
     if left_i >= right_i or top_i >= bottom_i:
         raise ValueError("Requested bounds yield an empty region.")
 
-    compose_region(manifest, manifest_path, (left_i, top_i, right_i, bottom_i), output_path)
+    return compose_region(manifest, manifest_path, (left_i, top_i, right_i, bottom_i), output_path)
 
 
 def parse_args() -> argparse.Namespace:
@@ -241,15 +671,15 @@ def main() -> None:
 
     if args.crop_pixels:
         left, top, right, bottom = args.crop_pixels
-        compose_region(manifest, manifest_path, (left, top, right, bottom), output_path)
+        compose_region(manifest, manifest_path, (left, top, right, bottom), output_path).result()
         return
 
     if args.crop_latlon:
         min_lat, min_lon, max_lat, max_lon = args.crop_latlon
-        crop_by_latlon(manifest, manifest_path, (min_lat, min_lon, max_lat, max_lon), output_path)
+        crop_by_latlon(manifest, manifest_path, (min_lat, min_lon, max_lat, max_lon), output_path).result()
         return
 
-    stitch_full(manifest, manifest_path, output_path)
+    stitch_full(manifest, manifest_path, output_path).result()
 
 
 if __name__ == "__main__":
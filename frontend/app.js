@@ -57,15 +57,27 @@ async function initializeDataset() {
       headers: { "Content-Type": "application/json" },
       body: JSON.stringify({}),
     });
-    const data = await response.json().catch(() => ({}));
-    if (!response.ok) {
-      const message = data.detail || data.message || `Initialisation failed (${response.status})`;
-      throw new Error(message);
-    }
-    if (data.status === "skipped") {
+    const contentType = response.headers.get("Content-Type") || "";
+    if (!response.ok || !contentType.includes("ndjson")) {
+      const data = await response.json().catch(() => ({}));
+      if (!response.ok) {
+        const message = data.detail || data.message || `Initialisation failed (${response.status})`;
+        throw new Error(message);
+      }
       logEl.textContent = data.message || "Tiles already present.";
     } else {
-      logEl.textContent = (data.stderr && data.stderr.trim()) || data.stdout || "Initialisation completed.";
+      logEl.textContent = "";
+      const result = await readConverterStream(response, (line) => {
+        logEl.textContent += `${line}\n`;
+        logEl.scrollTop = logEl.scrollHeight;
+      });
+      if (result && result.status === "ok") {
+        logEl.textContent += "Initialisation completed.";
+      } else {
+        const detail = result && result.detail;
+        const code = detail && detail.returncode;
+        logEl.textContent += code !== undefined ? `Converter exited with code ${code}.` : String(detail || "Initialisation failed.");
+      }
     }
     await loadScenes();
   } catch (err) {
@@ -76,6 +88,37 @@ async function initializeDataset() {
   }
 }
 
+// /init streams newline-delimited JSON: {"line": ...} events, then a final status object.
+async function readConverterStream(response, onLine) {
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  let result = null;
+  const handle = (raw) => {
+    if (!raw.trim()) {
+      return;
+    }
+    const event = JSON.parse(raw);
+    if (event.line !== undefined) {
+      onLine(event.line);
+    } else {
+      result = event;
+    }
+  };
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) {
+      break;
+    }
+    buffer += decoder.decode(value, { stream: true });
+    const lines = buffer.split("\n");
+    buffer = lines.pop();
+    lines.forEach(handle);
+  }
+  handle(buffer + decoder.decode());
+  return result;
+}
+
 async function loadScenes() {
   try {
     const response = await fetch(`${API_BASE}/images`);
@@ -262,7 +305,7 @@ async function fetchScenePreview(sceneId, endpoints) {
   let lastError;
   for (const endpoint of sequence) {
     try {
-      const response = await fetch(`${API_BASE}/images/${encodeURIComponent(sceneId)}/${endpoint}`);
+      const response = await fetchRendered(`${API_BASE}/images/${encodeURIComponent(sceneId)}/${endpoint}`);
       if (!response.ok) {
         lastError = new Error(`Endpoint ${endpoint} responded with ${response.status}`);
         if (endpoint === "preview" && response.status === 404) {
@@ -282,6 +325,22 @@ async function fetchScenePreview(sceneId, endpoints) {
   throw lastError || new Error("Preview request failed");
 }
 
+// Crop and full-scene renders answer 202 with a job id until the file is ready.
+// Polling gives up after `timeout` ms so a stuck job cannot spin forever.
+async function fetchRendered(url, pollInterval = 1000, timeout = 5 * 60 * 1000) {
+  const deadline = Date.now() + timeout;
+  let response = await fetch(url);
+  while (response.status === 202) {
+    if (Date.now() + pollInterval > deadline) {
+      throw new Error("The render is taking too long. Please try again later.");
+    }
+    const job = await response.json();
+    await new Promise((resolve) => setTimeout(resolve, pollInterval));
+    response = await fetch(`${API_BASE}/jobs/${encodeURIComponent(job.job_id)}`);
+  }
+  return response;
+}
+
 function applyScenePreview(img, sceneId, url) {
   img.src = url;
   img.alt = `${sceneId} preview`;
@@ -479,7 +538,7 @@ async function onCropRequest(event) {
   img.src = "";
 
   try {
-    const response = await fetch(url);
+    const response = await fetchRendered(url);
     if (!response.ok) {
       throw new Error("Crop request failed");
     }
@@ -493,7 +552,7 @@ async function onCropRequest(event) {
     img.alt = "Crop preview";
   } catch (err) {
     console.error(err);
-    img.alt = "Failed to load crop.";
+    img.alt = err.message || "Failed to load crop.";
   }
 }
 
@@ -502,7 +561,7 @@ async function downloadFullScene() {
     return;
   }
   try {
-    const response = await fetch(`${API_BASE}/images/${encodeURIComponent(state.currentScene.scene_id)}/full`);
+    const response = await fetchRendered(`${API_BASE}/images/${encodeURIComponent(state.currentScene.scene_id)}/full`);
     if (!response.ok) {
       throw new Error("Download failed");
     }
@@ -515,5 +574,6 @@ async function downloadFullScene() {
     URL.revokeObjectURL(url);
   } catch (err) {
     console.error(err);
+    window.alert(err.message || "Download failed.");
   }
 }
@@ -11,7 +11,9 @@ from __future__ import annotations
 
 import argparse
 import os
+import select
 import signal
+import socket
 import subprocess
 import sys
 import time
@@ -20,6 +22,7 @@ from typing import Dict, Iterable, Optional
 
 
 ROOT = Path(__file__).resolve().parent
+FRONTEND_DIR = ROOT / "frontend"
 RUN_DIR = ROOT / ".run"
 LOG_DIR = ROOT / "logs"
 RUN_DIR.mkdir(exist_ok=True)
@@ -41,6 +44,8 @@ def _env_int(name: str, default: int) -> int:
 
 BACKEND_PORT = _env_int("BACKEND_PORT", 8000)
 FRONTEND_PORT = _env_int("FRONTEND_PORT", 4173)
+# Seconds to wait for a freshly spawned service to accept connections.
+STARTUP_TIMEOUT = 5.0
 
 
 def backend_command() -> Iterable[str]:
@@ -49,11 +54,15 @@ def backend_command() -> Iterable[str]:
         "-m",
         "uvicorn",
         "backend.app.main:app",
+        "--app-dir",
+        str(ROOT),
         "--host",
         "0.0.0.0",
         "--port",
         str(BACKEND_PORT),
         "--reload",
+        "--reload-dir",
+        str(ROOT),
     )
 
 
@@ -63,19 +72,21 @@ def frontend_command() -> Iterable[str]:
         "-m",
         "http.server",
         str(FRONTEND_PORT),
+        "--directory",
+        str(FRONTEND_DIR),
     )
 
 
 SERVICES: Dict[str, Dict[str, object]] = {
     "backend": {
         "cmd": backend_command,
-        "cwd": ROOT,
+        "port": BACKEND_PORT,
         "pid_file": RUN_DIR / "backend.pid",
         "log_file": LOG_DIR / "backend.log",
     },
     "frontend": {
         "cmd": frontend_command,
-        "cwd": ROOT / "frontend",
+        "port": FRONTEND_PORT,
         "pid_file": RUN_DIR / "frontend.pid",
         "log_file": LOG_DIR / "frontend.log",
     },
@@ -114,6 +125,33 @@ def remove_pid(pid_file: Path) -> None:
         pass
 
 
+def _port_open(port: int) -> bool:
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=0.1):
+            return True
+    except OSError:
+        return False
+
+
+def _wait_for_port(process: subprocess.Popen, port: int, timeout: float = STARTUP_TIMEOUT) -> bool:
+    """Poll *port* on localhost with exponential backoff until it accepts a connection.
+
+    Returns False if *process* exits first or *timeout* seconds pass.
+    """
+
+    deadline = time.monotonic() + timeout
+    delay = 0.02
+    while process.poll() is None:
+        if _port_open(port):
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay *= 1.5
+    return False
+
+
 def start_service(name: str) -> None:
     svc = SERVICES[name]
     pid_file: Path = svc["pid_file"]  # type: ignore
@@ -123,20 +161,26 @@ def start_service(name: str) -> None:
         return
 
     cmd = tuple(svc["cmd"]()) if callable(svc["cmd"]) else tuple(svc["cmd"])  # type: ignore
-    cwd = Path(svc["cwd"])  # type: ignore
     log_file = Path(svc["log_file"])  # type: ignore
-    cwd.mkdir(parents=True, exist_ok=True)
+    port = int(svc["port"])  # type: ignore
+    if _port_open(port):
+        # Something else is listening; the startup probe could not tell it apart.
+        print(f"[{name}] port {port} is already in use; not starting")
+        return
 
     with open(log_file, "a", encoding="utf-8") as log:
         log.write(f"\n--- Starting {name} @ {time.strftime('%Y-%m-%d %H:%M:%S')} ---\n")
+        # Directories are passed as arguments rather than cwd=, and fds are left
+        # open (Python's own are non-inheritable anyway), so CPython can launch
+        # the child with posix_spawn instead of forking this interpreter.
         process = subprocess.Popen(  # noqa: S603, S607
             cmd,
-            cwd=str(cwd),
             stdout=log,
             stderr=log,
+            close_fds=False,
         )
 
-    time.sleep(0.75)
+    listening = _wait_for_port(process, port)
     if process.poll() is not None:
         remove_pid(pid_file)
         print(f"[{name}] failed to start (exit code {process.returncode}). See {log_file} for details.")
@@ -146,7 +190,39 @@ def start_service(name: str) -> None:
         return
 
     write_pid(pid_file, process.pid)
-    print(f"[{name}] started (PID {process.pid})")
+    svc["process"] = process
+    if listening:
+        print(f"[{name}] started (PID {process.pid})")
+    else:
+        print(f"[{name}] started (PID {process.pid}) but not yet listening on port {port}; see {log_file}")
+
+
+def _wait_for_exit(pid: int, timeout: float) -> bool:
+    """Wait up to *timeout* seconds for *pid*, which need not be our child, to exit."""
+
+    if hasattr(os, "pidfd_open"):
+        try:
+            fd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            fd = None  # kernel without pidfd support
+        if fd is not None:
+            try:
+                # The descriptor becomes readable the moment the process exits.
+                return bool(select.select([fd], [], [], timeout)[0])
+            finally:
+                os.close(fd)
+
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while is_running(pid):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.2)
+    return True
 
 
 def stop_service(name: str, timeout: float = 10.0) -> None:
@@ -166,18 +242,29 @@ def stop_service(name: str, timeout: float = 10.0) -> None:
         print(f"[{name}] process already stopped")
         return
 
-    deadline = time.time() + timeout
-    while time.time() < deadline:
-        if not is_running(pid):
-            break
-        time.sleep(0.2)
+    # A service started by this interpreter (e.g. on restart) is our child, so
+    # waitpid reports its exit directly and also reaps it.
+    process = svc.pop("process", None)
+    if not isinstance(process, subprocess.Popen) or process.pid != pid:
+        process = None
+    if process is not None:
+        try:
+            process.wait(timeout)
+            exited = True
+        except subprocess.TimeoutExpired:
+            exited = False
     else:
+        exited = _wait_for_exit(pid, timeout)
+
+    if not exited:
         kill_signal = getattr(signal, "SIGKILL", signal.SIGTERM)
         print(f"[{name}] did not exit in {timeout}s; sending {kill_signal.name}")
         try:
             os.kill(pid, kill_signal)
         except ProcessLookupError:
             pass
+        if process is not None:
+            process.wait()
 
     remove_pid(pid_file)
     print(f"[{name}] stopped")